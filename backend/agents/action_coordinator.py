@@ -1,17 +1,79 @@
 """Action coordinator agent for executing workflow actions."""
-import copy
-from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+import time
+from functools import cached_property
+from typing import Dict, Any, Awaitable, Callable, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
 
-from backend.models.actions import ActionRequest, ActionResult
-from backend.models.enums import ActionType, PayerStatus
+from backend.models.enums import ActionType
 from backend.mock_services.payer import PASubmission, PAResponse, CignaGateway, UHCGateway, GenericPayerGateway
 from backend.mock_services.scenarios import get_scenario_manager
-from backend.agents.recovery_agent import get_recovery_agent
+from backend.agents.recovery_agent import RecoveryAgent, get_recovery_agent
 from backend.config.logging_config import get_logger
+from backend.config.settings import get_settings
 
 logger = get_logger(__name__)
 
+# ActionType values resolved once at import for the handler return payloads
+_AT_SUBMIT_PA = ActionType.SUBMIT_PA.value
+_AT_SUBMIT_DOCS = ActionType.SUBMIT_DOCUMENTS.value
+_AT_SUBMIT_APPEAL = ActionType.SUBMIT_APPEAL.value
+_AT_CHECK_STATUS = ActionType.CHECK_STATUS.value
+
+# Payer statuses that warrant a status poll during monitoring
+MONITORED_STATUSES = frozenset({"submitted", "pending", "under_review", "appeal_pending"})
+
+# How long a generated appeal strategy is reused for the same case/payer/denial
+_APPEAL_STRATEGY_CACHE_TTL = 300  # seconds
+
+_APPEAL_LETTER_TEMPLATE = """
+Clinical Appeal for Prior Authorization
+Patient Case ID: {case_id}
+
+Primary Argument: {primary}
+
+Supporting Arguments:
+{supporting}
+
+Evidence Cited:
+{evidence}
+
+Success Probability Assessment: {prob:.0%}
+"""
+
+# Upper bound on per-case member-ID maps kept by the coordinator
+_MEMBER_ID_MAP_CACHE_SIZE = 256
+
+
+def _shallow_branch(payer_states: Dict[str, Dict[str, Any]], payer_name: str) -> Dict[str, Dict[str, Any]]:
+    """Branch payer_states for a single-payer update without mutating the original.
+
+    Only the target payer's dict is copied; every other entry aliases the
+    original, which is safe because handlers only assign top-level keys on
+    the target payer.
+    """
+    branched = dict(payer_states)
+    branched[payer_name] = dict(payer_states.get(payer_name, {}))
+    return branched
+
+
+class GatewayDispatch(NamedTuple):
+    """Bound gateway methods resolved once per payer for the action handlers."""
+    submit_pa: Callable[..., Awaitable[PAResponse]]
+    submit_documents: Callable[..., Awaitable[PAResponse]]
+    check_status: Callable[..., Awaitable[PAResponse]]
+    submit_appeal: Callable[..., Awaitable[PAResponse]]
+
+    @classmethod
+    def for_gateway(cls, gateway: Any) -> "GatewayDispatch":
+        return cls(gateway.submit_pa, gateway.submit_documents, gateway.check_status, gateway.submit_appeal)
+
+
+def _denied_payers(payer_states: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Index of payers currently in denied status, kept in state for recovery lookup."""
+    return [p for p, s in payer_states.items() if s.get("status") == "denied"]
+
 
 class ActionCoordinator:
     """
@@ -21,7 +83,11 @@ class ActionCoordinator:
 
     def __init__(self):
         """Initialize the action coordinator."""
-        self._payer_gateways: Dict[str, Any] = {}
+        self._payer_gateways: Dict[str, GatewayDispatch] = {}
+        self._raw_gateways: Dict[str, Any] = {}  # Gateway instances, as registered with the scenario manager
+        self._member_id_maps: Dict[str, Dict[str, str]] = {}  # case_id -> {payer_name: member_id}
+        self._appeal_strategy_cache: Dict[Tuple[str, ...], tuple] = {}  # key -> (strategy, timestamp)
+        self._scenario_manager = get_scenario_manager()
         self._initialize_gateways()
         logger.info("Action coordinator initialized")
 
@@ -31,33 +97,41 @@ class ActionCoordinator:
         Creates dedicated gateways for payers with custom implementations,
         and auto-creates generic gateways on demand for any other payer.
         """
-        scenario_manager = get_scenario_manager()
-
         # Dedicated gateway implementations
-        self._payer_gateways["Cigna"] = CignaGateway()
-        self._payer_gateways["UHC"] = UHCGateway()
+        self._raw_gateways["Cigna"] = CignaGateway()
+        self._raw_gateways["UHC"] = UHCGateway()
 
         # Register gateways with scenario manager
-        for payer_name, gateway in self._payer_gateways.items():
-            scenario_manager.register_gateway(payer_name, gateway)
+        for payer_name, gateway in self._raw_gateways.items():
+            self._payer_gateways[payer_name] = GatewayDispatch.for_gateway(gateway)
+            self._scenario_manager.register_gateway(payer_name, gateway)
 
-    def get_gateway(self, payer_name: str) -> Any:
-        """Get the gateway for a specific payer.
+    @cached_property
+    def _recovery_agent(self) -> RecoveryAgent:
+        """Recovery agent singleton, resolved on first recovery action."""
+        return get_recovery_agent()
+
+    def get_gateway(self, payer_name: str) -> GatewayDispatch:
+        """Get the gateway dispatch for a specific payer.
 
         If no dedicated gateway exists, creates a GenericPayerGateway on demand.
         This ensures all payers (including BCBS, Aetna, etc.) can use the
         action coordination workflow.
         """
         gateway = self._payer_gateways.get(payer_name)
-        if gateway is None:
-            # Auto-create generic gateway for unknown payers
-            prefix = payer_name[:3].upper().replace(" ", "")
-            gateway = GenericPayerGateway(name=payer_name, prefix=prefix)
-            self._payer_gateways[payer_name] = gateway
-            scenario_manager = get_scenario_manager()
-            scenario_manager.register_gateway(payer_name, gateway)
+        if gateway is not None:
+            return gateway
+        return self._create_generic_gateway(payer_name)
+
+    def _create_generic_gateway(self, payer_name: str) -> GatewayDispatch:
+        """Create and register a generic gateway for a payer without a dedicated one."""
+        prefix = payer_name[:3].upper().replace(" ", "")
+        candidate = GenericPayerGateway(name=payer_name, prefix=prefix)
+        gateway = self._raw_gateways.setdefault(payer_name, candidate)
+        if gateway is candidate:
+            self._scenario_manager.register_gateway(payer_name, gateway)
             logger.info("Auto-created generic gateway for payer", payer_name=payer_name)
-        return gateway
+        return self._payer_gateways.setdefault(payer_name, GatewayDispatch.for_gateway(gateway))
 
     async def execute_next_action(
         self,
@@ -101,7 +175,8 @@ class ActionCoordinator:
         payer_name: str
     ) -> Dict[str, Any]:
         """Execute a PA submission to a payer."""
-        logger.info("Submitting PA", payer=payer_name, case_id=state.get("case_id"))
+        if logger.is_enabled_for(logging.INFO):
+            logger.info("Submitting PA", payer=payer_name, case_id=state.get("case_id"))
 
         gateway = self.get_gateway(payer_name)
         if not gateway:
@@ -109,62 +184,72 @@ class ActionCoordinator:
 
         # Build submission from state
         patient_data = state.get("patient_data", {})
+        prescriber = patient_data.get("prescriber") or {}
+        clinical = patient_data.get("clinical_profile") or {}
         medication_data = state.get("medication_data", {})
         med_request = medication_data.get("medication_request", medication_data)
 
+        case_id = state.get("case_id", "")
+        member_id_map = self._member_id_maps.get(case_id)
+        if member_id_map is None:
+            member_id_map = self._build_member_id_map(patient_data)
+            if len(self._member_id_maps) >= _MEMBER_ID_MAP_CACHE_SIZE:
+                # Evict the oldest case (dicts preserve insertion order)
+                self._member_id_maps.pop(next(iter(self._member_id_maps)))
+            self._member_id_maps[case_id] = member_id_map
+
         submission = PASubmission(
-            case_id=state.get("case_id", ""),
-            patient_member_id=self._get_member_id(patient_data, payer_name),
+            case_id=case_id,
+            patient_member_id=member_id_map.get(payer_name, ""),
             patient_name=self._get_patient_name(patient_data),
             medication_name=med_request.get("medication_name", ""),
             medication_ndc=med_request.get("ndc_code", ""),
             diagnosis_codes=self._get_diagnosis_codes(patient_data),
-            prescriber_npi=patient_data.get("prescriber", {}).get("npi", ""),
-            prescriber_name=patient_data.get("prescriber", {}).get("name", ""),
+            prescriber_npi=prescriber.get("npi", ""),
+            prescriber_name=prescriber.get("name", ""),
             clinical_rationale=med_request.get("clinical_rationale", ""),
-            prior_treatments=patient_data.get("clinical_profile", {}).get("prior_treatments", []),
-            lab_results=patient_data.get("clinical_profile", {}).get("lab_results", [])
+            prior_treatments=clinical.get("prior_treatments", []),
+            lab_results=clinical.get("lab_results", [])
         )
 
         # Submit to gateway
         response = await gateway.submit_pa(submission)
+        now_iso = datetime.now(timezone.utc).isoformat()
+        resp_dict = response.to_dict()
+        payer_status = response.to_payer_status_value()
 
-        # Update payer state (deep copy to avoid mutating orchestrator state)
-        updated_payer_states = copy.deepcopy(state.get("payer_states", {}))
+        # Update payer state (branch to avoid mutating orchestrator state)
+        updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
         updated_payer_states[payer_name] = {
             "payer_name": payer_name,
-            "status": response.to_payer_status_value(),
+            "status": payer_status,
             "reference_number": response.reference_number,
-            "submitted_at": datetime.now(timezone.utc).isoformat(),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-            "response_details": response.to_dict(),
+            "submitted_at": now_iso,
+            "last_updated": now_iso,
+            "response_details": resp_dict,
             "required_documents": response.required_documents or [],
             "denial_reason": response.denial_reason,
             "appeal_deadline": response.appeal_deadline.isoformat() if response.appeal_deadline else None
         }
 
-        # Update payer responses
-        updated_responses = dict(state.get("payer_responses", {}))
-        updated_responses[payer_name] = response.to_dict()
-
         # Auto-capture outcome for prediction tracking when payer gives a terminal decision
-        payer_status = response.to_payer_status_value()
         if payer_status in ("approved", "denied"):
             await self._record_prediction_outcome(state, payer_name, payer_status)
 
         return {
-            "action_type": ActionType.SUBMIT_PA.value,
+            "action_type": _AT_SUBMIT_PA,
             "target_payer": payer_name,
             "payer_states": updated_payer_states,
-            "payer_responses": updated_responses,
-            "completed_actions": [{
-                "action_type": ActionType.SUBMIT_PA.value,
+            "denied_payers": _denied_payers(updated_payer_states),
+            "payer_responses": {payer_name: resp_dict},  # Delta, merged by state reducer
+            "completed_actions": ({
+                "action_type": _AT_SUBMIT_PA,
                 "payer": payer_name,
                 "reference_number": response.reference_number,
-                "status": response.to_payer_status_value(),
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }],
-            "messages": [f"PA submitted to {payer_name}: {response.reference_number}"]
+                "status": payer_status,
+                "timestamp": now_iso
+            },),
+            "messages": (f"PA submitted to {payer_name}: {response.reference_number}",)
         }
 
     async def _handle_pending_info(
@@ -181,7 +266,7 @@ class ActionCoordinator:
 
         if not required_docs:
             return {
-                "action_type": "check_status",
+                "action_type": _AT_CHECK_STATUS,
                 "message": f"No documents requested by {payer_name}"
             }
 
@@ -193,23 +278,25 @@ class ActionCoordinator:
                 reference_number=reference,
                 documents=[{"type": doc, "submitted": True} for doc in required_docs]
             )
+            now_iso = datetime.now(timezone.utc).isoformat()
 
-            # Update state (deep copy to avoid mutating orchestrator state)
-            updated_payer_states = copy.deepcopy(state.get("payer_states", {}))
+            # Update state (branch to avoid mutating orchestrator state)
+            updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
             updated_payer_states[payer_name]["status"] = doc_response.to_payer_status_value()
-            updated_payer_states[payer_name]["last_updated"] = datetime.now(timezone.utc).isoformat()
+            updated_payer_states[payer_name]["last_updated"] = now_iso
 
             return {
-                "action_type": ActionType.SUBMIT_DOCUMENTS.value,
+                "action_type": _AT_SUBMIT_DOCS,
                 "target_payer": payer_name,
                 "payer_states": updated_payer_states,
-                "completed_actions": [{
-                    "action_type": ActionType.SUBMIT_DOCUMENTS.value,
+                "denied_payers": _denied_payers(updated_payer_states),
+                "completed_actions": ({
+                    "action_type": _AT_SUBMIT_DOCS,
                     "payer": payer_name,
                     "documents_submitted": required_docs,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }],
-                "messages": [f"Submitted {len(required_docs)} documents to {payer_name}"]
+                    "timestamp": now_iso
+                },),
+                "messages": (f"Submitted {len(required_docs)} documents to {payer_name}",)
             }
 
         return {"error": f"Cannot submit documents to {payer_name}"}
@@ -224,22 +311,23 @@ class ActionCoordinator:
         The RecoveryAgent classifies the denial, generates recovery strategies,
         and selects the optimal approach before execution.
         """
-        logger.info("Executing recovery", case_id=state.get("case_id"))
+        log_info = logger.is_enabled_for(logging.INFO)
+        if log_info:
+            logger.info("Executing recovery", case_id=state.get("case_id"))
 
         # Find denied payer
         payer_states = state.get("payer_states", {})
-        denied_payer = None
-        denial_response = None
-
-        for payer_name, payer_state in payer_states.items():
-            if payer_state.get("status") == "denied":
-                denied_payer = payer_name
-                denial_response = payer_state.get("response_details", {})
-                break
+        denied_list = state.get("denied_payers")
+        if denied_list is None:
+            # Index absent (e.g. state built outside the graph): fall back to a scan
+            denied_list = _denied_payers(payer_states)
+        denied_payer = denied_list[0] if denied_list else None
 
         if not denied_payer:
             return {"message": "No denial found for recovery"}
 
+        denial_response = payer_states[denied_payer].get("response_details", {})
+
         gateway = self.get_gateway(denied_payer)
         if not gateway:
             return {"error": f"No gateway for {denied_payer}"}
@@ -247,7 +335,7 @@ class ActionCoordinator:
         reference = payer_states[denied_payer].get("reference_number", "")
 
         # Use RecoveryAgent for intelligent recovery
-        recovery_agent = get_recovery_agent()
+        recovery_agent = self._recovery_agent
 
         # Build case state for recovery agent
         case_state = {
@@ -255,21 +343,25 @@ class ActionCoordinator:
             "patient_data": state.get("patient_data", {}),
             "medication_data": state.get("medication_data", {}),
             "documentation_gaps": state.get("documentation_gaps", []),
-            "payers": list(payer_states.keys()),
+            "payers": tuple(payer_states),
             "recovery_payer": denied_payer,
             "recovery_reason": state.get("recovery_reason", "Payer denial")
         }
 
-        # Classify the denial (LLM-powered)
-        classification = await recovery_agent.classify_denial(denial_response, case_state)
-
-        logger.info(
-            "Denial classified",
-            denial_type=classification.denial_type,
-            is_recoverable=classification.is_recoverable,
-            root_cause=classification.root_cause
+        # Classify the denial (LLM-powered), loading the policy text it doesn't depend on alongside
+        classification, policy_context = await asyncio.gather(
+            recovery_agent.classify_denial(denial_response, case_state),
+            recovery_agent.load_policy_context(case_state, denied_payer)
         )
 
+        if log_info:
+            logger.info(
+                "Denial classified",
+                denial_type=classification.denial_type,
+                is_recoverable=classification.is_recoverable,
+                root_cause=classification.root_cause
+            )
+
         if not classification.is_recoverable:
             return {
                 "action_type": "no_recovery_path",
@@ -282,24 +374,26 @@ class ActionCoordinator:
                 "recovery_needed": False,
                 "is_complete": True,
                 "final_outcome": f"Denial not recoverable: {classification.denial_type}",
-                "messages": [f"No recovery path for {denied_payer}: {classification.denial_type}"]
+                "messages": (f"No recovery path for {denied_payer}: {classification.denial_type}",)
             }
 
         # Generate recovery strategy options (LLM-powered)
         recovery_options = await recovery_agent.generate_recovery_strategies(
             classification=classification,
             case_state=case_state,
-            payer_name=denied_payer
+            payer_name=denied_payer,
+            policy_context=policy_context
         )
 
         # Select the best recovery strategy (LLM-recommended)
         recovery_strategy = await recovery_agent.select_recovery_strategy(recovery_options, case_state)
 
-        logger.info(
-            "Recovery strategy selected",
-            option=recovery_strategy.selected_option,
-            parallel=recovery_strategy.parallel_actions
-        )
+        if log_info:
+            logger.info(
+                "Recovery strategy selected",
+                option=recovery_strategy.selected_option,
+                parallel=recovery_strategy.parallel_actions
+            )
 
         # Execute based on selected option
         if recovery_strategy.selected_option in ["PEER_TO_PEER_REVIEW"]:
@@ -320,7 +414,7 @@ class ActionCoordinator:
         self,
         state: Dict[str, Any],
         payer_name: str,
-        gateway: Any,
+        gateway: GatewayDispatch,
         reference: str,
         classification: Any,
         recovery_strategy: Any
@@ -329,35 +423,37 @@ class ActionCoordinator:
         logger.info("Executing written appeal", payer=payer_name)
 
         # Generate appeal strategy using Claude (for complex cases)
-        recovery_agent = get_recovery_agent()
+        recovery_agent = self._recovery_agent
         denial_response = state.get("payer_states", {}).get(payer_name, {}).get("response_details", {})
 
+        cache_key = (
+            state.get("case_id", ""), payer_name, classification.denial_type, classification.root_cause
+        )
         try:
-            appeal_strategy = await recovery_agent.generate_appeal_strategy(
-                denial_response=denial_response,
-                case_state={
-                    "case_id": state.get("case_id"),
-                    "patient_data": state.get("patient_data"),
-                    "medication_data": state.get("medication_data"),
-                    "available_documents": state.get("documentation_gaps", [])
-                },
-                payer_name=payer_name
+            appeal_strategy = self._get_cached_appeal_strategy(cache_key)
+            if appeal_strategy is None:
+                appeal_strategy = await asyncio.wait_for(
+                    recovery_agent.generate_appeal_strategy(
+                        denial_response=denial_response,
+                        case_state={
+                            "case_id": state.get("case_id"),
+                            "patient_data": state.get("patient_data"),
+                            "medication_data": state.get("medication_data"),
+                            "available_documents": state.get("documentation_gaps", [])
+                        },
+                        payer_name=payer_name
+                    ),
+                    timeout=get_settings().appeal_strategy_timeout_seconds
+                )
+                self._cache_appeal_strategy(cache_key, appeal_strategy)
+
+            appeal_letter = _APPEAL_LETTER_TEMPLATE.format(
+                case_id=state.get("case_id"),
+                primary=appeal_strategy.primary_clinical_argument,
+                supporting="\n".join([f"- {arg}" for arg in appeal_strategy.supporting_arguments]),
+                evidence="\n".join([f"- {ev}" for ev in appeal_strategy.evidence_to_cite]),
+                prob=appeal_strategy.success_probability
             )
-
-            appeal_letter = f"""
-Clinical Appeal for Prior Authorization
-Patient Case ID: {state.get('case_id')}
-
-Primary Argument: {appeal_strategy.primary_clinical_argument}
-
-Supporting Arguments:
-{chr(10).join('- ' + arg for arg in appeal_strategy.supporting_arguments)}
-
-Evidence Cited:
-{chr(10).join('- ' + ev for ev in appeal_strategy.evidence_to_cite)}
-
-Success Probability Assessment: {appeal_strategy.success_probability:.0%}
-"""
         except Exception as e:
             logger.error("Claude appeal strategy generation failed", error=str(e), error_type=type(e).__name__)
             raise
@@ -368,18 +464,19 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
             appeal_letter=appeal_letter,
             supporting_documents=[{"type": "medical_records"}, {"type": "lab_results"}]
         )
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         # Update state
-        payer_states = state.get("payer_states", {})
-        updated_payer_states = copy.deepcopy(payer_states)
+        updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
         updated_payer_states[payer_name]["status"] = appeal_response.to_payer_status_value()
         updated_payer_states[payer_name]["appeal_reference"] = appeal_response.reference_number
-        updated_payer_states[payer_name]["last_updated"] = datetime.now(timezone.utc).isoformat()
+        updated_payer_states[payer_name]["last_updated"] = now_iso
 
         return {
-            "action_type": ActionType.SUBMIT_APPEAL.value,
+            "action_type": _AT_SUBMIT_APPEAL,
             "target_payer": payer_name,
             "payer_states": updated_payer_states,
+            "denied_payers": _denied_payers(updated_payer_states),
             "recovery_needed": False,
             "denial_classification": {
                 "type": classification.denial_type,
@@ -390,40 +487,60 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
                 "selected_option": recovery_strategy.selected_option,
                 "reasoning": recovery_strategy.selection_reasoning
             },
-            "completed_actions": [{
-                "action_type": ActionType.SUBMIT_APPEAL.value,
+            "completed_actions": ({
+                "action_type": _AT_SUBMIT_APPEAL,
                 "payer": payer_name,
                 "appeal_reference": appeal_response.reference_number,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }],
-            "messages": [f"Written appeal submitted to {payer_name}: {appeal_response.reference_number}"]
+                "timestamp": now_iso
+            },),
+            "messages": (f"Written appeal submitted to {payer_name}: {appeal_response.reference_number}",)
         }
 
+    def _get_cached_appeal_strategy(self, key: Tuple[str, ...]) -> Optional[Any]:
+        """Return a cached appeal strategy if it is still within its TTL."""
+        cached = self._appeal_strategy_cache.get(key)
+        if cached:
+            strategy, ts = cached
+            if time.monotonic() - ts < _APPEAL_STRATEGY_CACHE_TTL:
+                logger.debug("Reusing cached appeal strategy", case_id=key[0], payer=key[1])
+                return strategy
+            del self._appeal_strategy_cache[key]
+        return None
+
+    def _cache_appeal_strategy(self, key: Tuple[str, ...], strategy: Any) -> None:
+        """Cache an appeal strategy, pruning expired entries."""
+        now = time.monotonic()
+        expired = [k for k, (_, ts) in self._appeal_strategy_cache.items() if now - ts >= _APPEAL_STRATEGY_CACHE_TTL]
+        for k in expired:
+            del self._appeal_strategy_cache[k]
+        self._appeal_strategy_cache[key] = (strategy, now)
+
     async def _execute_p2p_recovery(
         self,
         state: Dict[str, Any],
         payer_name: str,
-        gateway: Any,
+        gateway: GatewayDispatch,
         reference: str,
         classification: Any,
         recovery_strategy: Any
     ) -> Dict[str, Any]:
         """Execute a peer-to-peer review recovery action."""
         logger.info("Executing P2P review", payer=payer_name)
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         # For P2P, we prepare materials and schedule the review
         # This is simulated since we don't have actual P2P scheduling
 
-        payer_states = state.get("payer_states", {})
-        updated_payer_states = copy.deepcopy(payer_states)
+        updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
         updated_payer_states[payer_name]["status"] = "p2p_scheduled"
         updated_payer_states[payer_name]["p2p_scheduled"] = True
-        updated_payer_states[payer_name]["last_updated"] = datetime.now(timezone.utc).isoformat()
+        updated_payer_states[payer_name]["last_updated"] = now_iso
 
         return {
             "action_type": "schedule_p2p",
             "target_payer": payer_name,
             "payer_states": updated_payer_states,
+            "denied_payers": _denied_payers(updated_payer_states),
             "recovery_needed": False,
             "denial_classification": {
                 "type": classification.denial_type,
@@ -433,25 +550,27 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
                 "selected_option": recovery_strategy.selected_option,
                 "reasoning": recovery_strategy.selection_reasoning
             },
-            "completed_actions": [{
+            "completed_actions": ({
                 "action_type": "schedule_p2p",
                 "payer": payer_name,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }],
-            "messages": [f"P2P review scheduled with {payer_name}"]
+                "timestamp": now_iso
+            },),
+            "messages": (f"P2P review scheduled with {payer_name}",)
         }
 
     async def _execute_document_chase_recovery(
         self,
         state: Dict[str, Any],
         payer_name: str,
-        gateway: Any,
+        gateway: GatewayDispatch,
         reference: str,
         classification: Any,
         recovery_strategy: Any
     ) -> Dict[str, Any]:
         """Execute document chase recovery action."""
-        logger.info("Executing document chase", payer=payer_name, linked_gap=classification.linked_intake_gap)
+        if logger.is_enabled_for(logging.INFO):
+            logger.info("Executing document chase", payer=payer_name, linked_gap=classification.linked_intake_gap)
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         # Identify missing documents from the linked intake gap
         documentation_gaps = state.get("documentation_gaps", [])
@@ -465,16 +584,16 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
         if not missing_docs:
             missing_docs = ["Additional clinical documentation"]
 
-        payer_states = state.get("payer_states", {})
-        updated_payer_states = copy.deepcopy(payer_states)
+        updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
         updated_payer_states[payer_name]["status"] = "document_chase"
         updated_payer_states[payer_name]["pending_documents"] = missing_docs
-        updated_payer_states[payer_name]["last_updated"] = datetime.now(timezone.utc).isoformat()
+        updated_payer_states[payer_name]["last_updated"] = now_iso
 
         return {
             "action_type": "document_chase",
             "target_payer": payer_name,
             "payer_states": updated_payer_states,
+            "denied_payers": _denied_payers(updated_payer_states),
             "recovery_needed": True,  # Still needs recovery after docs obtained
             "denial_classification": {
                 "type": classification.denial_type,
@@ -487,13 +606,13 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
                 "parallel_actions": recovery_strategy.parallel_actions
             },
             "pending_documents": missing_docs,
-            "completed_actions": [{
+            "completed_actions": ({
                 "action_type": "document_chase",
                 "payer": payer_name,
                 "documents_requested": missing_docs,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }],
-            "messages": [f"Document chase initiated for {payer_name}: {', '.join(missing_docs)}"]
+                "timestamp": now_iso
+            },),
+            "messages": (f"Document chase initiated for {payer_name}: {', '.join(missing_docs)}",)
         }
 
     async def check_payer_status(
@@ -513,57 +632,137 @@ Success Probability Assessment: {appeal_strategy.success_probability:.0%}
             return {"error": f"No reference number for {payer_name}"}
 
         response = await gateway.check_status(reference)
+        now_iso = datetime.now(timezone.utc).isoformat()
+        resp_dict = response.to_dict()
+        payer_status = response.to_payer_status_value()
 
         # Update state
-        updated_payer_states = copy.deepcopy(state.get("payer_states", {}))
+        updated_payer_states = _shallow_branch(state.get("payer_states", {}), payer_name)
         current_state = updated_payer_states.get(payer_name, {})
         updated_payer_states[payer_name] = {
             "payer_name": payer_name,
-            "status": response.to_payer_status_value(),
+            "status": payer_status,
             "reference_number": current_state.get("reference_number") or response.reference_number,
             "submitted_at": current_state.get("submitted_at"),
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-            "response_details": response.to_dict(),
+            "last_updated": now_iso,
+            "response_details": resp_dict,
             "required_documents": response.required_documents or [],
             "denial_reason": response.denial_reason,
             "appeal_deadline": response.appeal_deadline.isoformat() if response.appeal_deadline else None
         }
 
         # Check if response triggers recovery
-        recovery_needed = response.to_payer_status_value() == "denied" and response.appeal_deadline is not None
+        recovery_needed = payer_status == "denied" and response.appeal_deadline is not None
 
         return {
-            "action_type": ActionType.CHECK_STATUS.value,
+            "action_type": _AT_CHECK_STATUS,
             "target_payer": payer_name,
             "payer_states": updated_payer_states,
-            "payer_responses": {
-                **state.get("payer_responses", {}),
-                payer_name: response.to_dict()
-            },
+            "denied_payers": _denied_payers(updated_payer_states),
+            "payer_responses": {payer_name: resp_dict},  # Delta, merged by state reducer
             "recovery_needed": recovery_needed,
             "recovery_reason": f"{payer_name} denied" if recovery_needed else None,
-            "messages": [f"{payer_name} status: {response.to_payer_status_value()}"]
+            "messages": (f"{payer_name} status: {payer_status}",)
         }
 
-    def _get_member_id(self, patient_data: Dict[str, Any], payer_name: str) -> str:
-        """Get member ID for a payer."""
+    async def check_all_payers_status(
+        self,
+        state: Dict[str, Any],
+        statuses: frozenset = MONITORED_STATUSES
+    ) -> Dict[str, Any]:
+        """
+        Poll every payer whose status is in ``statuses`` concurrently.
+
+        Results are merged in payer-sequence order so the update is
+        deterministic regardless of which gateway responds first. A failed
+        check is logged and leaves that payer's state unchanged.
+
+        Args:
+            state: Current orchestrator state
+            statuses: Payer statuses that should be polled
+
+        Returns:
+            Merged state updates (payer_states, payer_responses, recovery flags)
+        """
+        payer_states = state.get("payer_states", {})
+        selected_strategy = state.get("selected_strategy") or {}
+        ordered = list(dict.fromkeys([
+            *(p for p in selected_strategy.get("payer_sequence", []) if p in payer_states),
+            *payer_states
+        ]))
+        targets = [
+            p for p in ordered
+            if payer_states[p].get("status", "not_submitted") in statuses
+        ]
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._safe_check_payer_status(state, p)) for p in targets]
+
+        updated_payer_states = dict(payer_states)
+        payer_responses: Dict[str, Dict[str, Any]] = {}
+        recovery_needed = False
+        recovery_reason = None
+        messages: List[str] = []
+        for payer_name, task in zip(targets, tasks):
+            result = task.result()
+            if not result:
+                continue
+            if payer_name in result.get("payer_states", {}):
+                updated_payer_states[payer_name] = result["payer_states"][payer_name]
+            payer_responses.update(result.get("payer_responses", {}))
+            if result.get("recovery_needed"):
+                recovery_needed = True
+                recovery_reason = result.get("recovery_reason")
+            messages.extend(result.get("messages", []))
+
+        return {
+            "payer_states": updated_payer_states,
+            "denied_payers": _denied_payers(updated_payer_states),
+            "payer_responses": payer_responses,
+            "recovery_needed": recovery_needed,
+            "recovery_reason": recovery_reason,
+            "messages": messages
+        }
+
+    async def _safe_check_payer_status(
+        self,
+        state: Dict[str, Any],
+        payer_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Run check_payer_status, logging failures instead of cancelling sibling checks."""
+        try:
+            return await self.check_payer_status(state, payer_name)
+        except Exception as e:
+            logger.error("Failed to check payer status", payer=payer_name, error=str(e))
+            return None
+
+    @staticmethod
+    def _build_member_id_map(patient_data: Dict[str, Any]) -> Dict[str, str]:
+        """Map payer name to member ID for the patient's primary/secondary insurance."""
         insurance = patient_data.get("insurance", {})
-        if insurance.get("primary", {}).get("payer_name") == payer_name:
-            return insurance["primary"].get("member_id", "")
-        if insurance.get("secondary", {}).get("payer_name") == payer_name:
-            return insurance["secondary"].get("member_id", "")
-        return ""
+        member_ids: Dict[str, str] = {}
+        # Secondary first so primary wins if both name the same payer
+        for slot in ("secondary", "primary"):
+            coverage = insurance.get(slot) or {}
+            payer = coverage.get("payer_name")
+            if payer:
+                member_ids[payer] = coverage.get("member_id", "")
+        return member_ids
 
     def _get_patient_name(self, patient_data: Dict[str, Any]) -> str:
         """Get patient full name."""
         demo = patient_data.get("demographics", {})
-        return f"{demo.get('first_name', '')} {demo.get('last_name', '')}".strip()
+        first = demo.get("first_name", "")
+        last = demo.get("last_name", "")
+        if first and last:
+            return f"{first} {last}"
+        return (first or last).strip()
 
     def _get_diagnosis_codes(self, patient_data: Dict[str, Any]) -> List[str]:
         """Get diagnosis codes."""
-        clinical = patient_data.get("clinical_profile", {})
-        diagnoses = clinical.get("diagnoses", [])
-        return [d.get("icd10_code", "") for d in diagnoses if d.get("icd10_code")]
+        clinical = patient_data.get("clinical_profile") or {}
+        diagnoses = clinical.get("diagnoses", ())
+        return [code for d in diagnoses if (code := d.get("icd10_code"))]
 
     async def _record_prediction_outcome(
         self,
@@ -1,19 +1,177 @@
 """Intake agent for validating and preparing case data."""
-from typing import Dict, Any, List, Optional
+import asyncio
+import copy
+import os
+import time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
 from datetime import datetime, timezone
-import json
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+
+import aiofiles
+import aiofiles.os
+import ijson
+import orjson
 
 from backend.models.case_state import CaseState, PatientInfo, MedicationRequest, PayerState
 from backend.models.enums import CaseStage, PayerStatus
 from backend.config.logging_config import get_logger
 from backend.config.settings import get_settings
+from backend.mcp.npi_validator import get_npi_validator
+from backend.mcp.icd10_validator import ICD10CodeInfo, ICD10ValidationResult, get_icd10_validator
+from backend.mcp.cms_coverage import get_cms_coverage_client
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Process-wide cap on in-flight MCP calls so fan-out stays below the HTTP pool limit
+_MCP_SEM = asyncio.Semaphore(get_settings().mcp_max_concurrency or 16)
+
+# Provider registrations and code definitions change on a scale of months,
+# so definitive NPI / ICD-10 lookups are shared process-wide for a day.
+_VALIDATION_CACHE_TTL = 86400  # seconds
+_validation_cache = AsyncTTLCache(maxsize=4096, default_ttl=_VALIDATION_CACHE_TTL)
+
+# Whole epoch second and its ISO-8601 string, shared by intakes stamped in the same second
+_INTAKE_TS_CACHE: List[Any] = [0, ""]
+
+# Day ordinal and its YYYYMMDD string, rolled over on the first case ID of each day
+_CASE_ID_DATE: Dict[str, Any] = {"day": None, "str": ""}
+
+# Top-level patient record keys read during intake; oversize files are
+# stream-parsed for just these.
+_INTAKE_KEYS = frozenset({
+    "patient_id", "demographics", "insurance", "prescriber", "medication_request",
+    "diagnoses", "allergies", "contraindications", "prior_treatments",
+    "laboratory_results", "lab_results", "clinical_profile",
+})
+
+# Demographic fields read by _build_patient_info, with their empty defaults
+_DEMOGRAPHIC_DEFAULTS = {"first_name": "", "last_name": "", "date_of_birth": ""}
+_get_demographics = itemgetter(*_DEMOGRAPHIC_DEFAULTS)
+
+# Normalized-view insurance slots in payer sequence order, with the fallback payer name
+_PAYER_SLOTS = (("insurance_primary", "Primary"), ("insurance_secondary", "Secondary"))
+
+# Required fields as (path into the normalized patient view, error message).
+# A field is skipped when its parent path is already reported missing.
+_REQUIRED_FIELDS = (
+    ("demographics.first_name", "Missing required field: demographics.first_name"),
+    ("demographics.last_name", "Missing required field: demographics.last_name"),
+    ("demographics.date_of_birth", "Missing required field: demographics.date_of_birth"),
+    ("insurance_primary", "Missing primary insurance information"),
+    ("insurance_primary.payer_name", "Missing primary payer name"),
+    ("insurance_primary.member_id", "Missing primary member ID"),
+    ("diagnoses", "Missing diagnosis information"),
+    ("medication.medication_name", "Missing required field: medication_request.medication_name"),
+    ("medication.dose", "Missing required field: medication_request.dose"),
+    ("prescriber.npi", "Missing prescriber NPI"),
+)
+_REQUIRED_FIELD_SPECS = tuple((tuple(path.split(".")), label) for path, label in _REQUIRED_FIELDS)
+
+# Whole run_mcp_validations results, keyed by their inputs, for repeat intakes
+_VALIDATION_RESULT_CACHE_TTL = 300  # seconds
+_VALIDATION_RESULT_CACHE_SIZE = 256
+
+# Error prefixes the MCP validators use for transient failures (never cached)
+_TRANSIENT_ERROR_PREFIXES = ("Validation service error", "Validation error", "Invalid API response")
 
-@dataclass
+
+def _is_definitive(lookup: Any) -> bool:
+    """True if a validator result reflects the registry's answer rather than a service failure."""
+    return lookup.is_valid or not any(e.startswith(_TRANSIENT_ERROR_PREFIXES) for e in lookup.errors)
+
+
+def _npi_luhn_ok(npi: str) -> bool:
+    """Check an NPI's structure and check digit locally.
+
+    NPIs use the Luhn algorithm over the ISO prefix 80840 plus the 10 digits,
+    so malformed NPIs can be rejected without a registry round-trip.
+    """
+    if len(npi) != 10 or not npi.isdigit():
+        return False
+    total = 0
+    for i, ch in enumerate(reversed("80840" + npi)):
+        digit = int(ch)
+        if i % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def _intake_timestamp() -> str:
+    """Current UTC time as ISO-8601, at whole-second precision."""
+    second = int(time.time())
+    if _INTAKE_TS_CACHE[0] != second:
+        _INTAKE_TS_CACHE[0] = second
+        _INTAKE_TS_CACHE[1] = datetime.fromtimestamp(second, timezone.utc).isoformat()
+    return _INTAKE_TS_CACHE[1]
+
+
+def _dig(data: Dict[str, Any], parts: tuple) -> Any:
+    """Walk pre-split keys into nested dicts, returning None if any level is missing."""
+    for key in parts:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _scan_diagnoses(diagnoses: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+    """Collect ICD-10 codes and pick the primary diagnosis in one pass.
+
+    The primary diagnosis is the first ranked "primary", else the first entry.
+    """
+    codes = []
+    primary = None
+    for d in diagnoses:
+        code = d.get("icd10_code")
+        if code:
+            codes.append(code)
+        if primary is None and d.get("rank") == "primary":
+            primary = d
+    if primary is None:
+        primary = diagnoses[0] if diagnoses else {}
+    return codes, primary
+
+
+def _normalize_patient_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve the patient record's layout variants into a flat view.
+
+    Patient files keep clinical lists either at the root or under
+    clinical_profile (backwards compat). Resolving the fallbacks and the
+    primary diagnosis once lets every intake step read the same view.
+    """
+    clinical_profile = data.get("clinical_profile", {})
+    insurance = data.get("insurance", {})
+    diagnoses = data.get("diagnoses") or clinical_profile.get("diagnoses", [])
+    diagnosis_codes, primary_diagnosis = _scan_diagnoses(diagnoses)
+    return {
+        "patient_id": data.get("patient_id", "unknown"),
+        "demographics": data.get("demographics", {}),
+        "insurance_primary": insurance.get("primary") or {},
+        "insurance_secondary": insurance.get("secondary") or {},
+        "medication": data.get("medication_request", {}),
+        "prescriber": data.get("prescriber", {}),
+        "diagnoses": diagnoses,
+        "diagnosis_codes": diagnosis_codes,
+        "primary_diagnosis": primary_diagnosis,
+        "allergies": data.get("allergies") or clinical_profile.get("allergies", []),
+        "contraindications": data.get("contraindications") or clinical_profile.get("contraindications", []),
+        "prior_treatments": data.get("prior_treatments") or clinical_profile.get("prior_treatments", []),
+        "lab_results": (
+            data.get("laboratory_results") or data.get("lab_results") or clinical_profile.get("lab_results", [])
+        ),
+    }
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of external validation checks."""
     npi_valid: bool = False
@@ -40,14 +198,19 @@ class IntakeAgent:
     - CMS Coverage - Medicare policy lookup
     """
 
-    def __init__(self, patients_dir: Optional[Path] = None):
+    def __init__(self, patients_dir: Optional[Path] = None, mcp_semaphore: Optional[asyncio.Semaphore] = None):
         """
         Initialize the intake agent.
 
         Args:
             patients_dir: Directory containing patient data files
+            mcp_semaphore: Semaphore bounding concurrent MCP calls (defaults to the shared one)
         """
         self.patients_dir = patients_dir or Path(get_settings().patients_dir)
+        self._mcp_semaphore = mcp_semaphore or _MCP_SEM
+        self._validation_results = AsyncTTLCache(
+            maxsize=_VALIDATION_RESULT_CACHE_SIZE, default_ttl=_VALIDATION_RESULT_CACHE_TTL
+        )
         logger.info("Intake agent initialized")
 
     async def process_intake(
@@ -71,21 +234,22 @@ class IntakeAgent:
         logger.info("Processing intake", patient_id=patient_id)
 
         # Load patient data
-        patient_data = await self.load_patient_data(patient_id)
+        patient_data = await self.load_patient_data(patient_id, keys=_INTAKE_KEYS)
+        view = _normalize_patient_data(patient_data)
 
         # Validate data
-        validation_result = self.validate_patient_data(patient_data)
+        validation_result = self.validate_patient_data(patient_data, view)
         if not validation_result["valid"]:
             raise ValueError(f"Invalid patient data: {validation_result['errors']}")
 
         # Create PatientInfo
-        patient_info = self._build_patient_info(patient_data)
+        patient_info = self._build_patient_info(view)
 
         # Create MedicationRequest
-        medication_request = self._build_medication_request(patient_data)
+        medication_request = self._build_medication_request(view)
 
         # Initialize payer states
-        payer_states = self._initialize_payer_states(patient_data)
+        payer_states = self._initialize_payer_states(view)
 
         # Create case state
         case_state = CaseState(
@@ -95,24 +259,15 @@ class IntakeAgent:
             medication=medication_request,
             payer_states=payer_states,
             metadata={
-                "intake_timestamp": datetime.now(timezone.utc).isoformat(),
+                "intake_timestamp": _intake_timestamp(),
                 "source_patient_id": patient_id,
                 "validation_result": validation_result
             }
         )
 
         # Run clinical validations (always mandatory)
-        validation_result = await self.run_mcp_validations(patient_data)
-        case_state.metadata["clinical_validation"] = {
-            "npi_valid": validation_result.npi_valid,
-            "npi_details": validation_result.npi_details,
-            "icd10_valid": validation_result.icd10_valid,
-            "icd10_details": validation_result.icd10_details,
-            "cms_coverage_found": validation_result.cms_coverage_found,
-            "cms_policies": validation_result.cms_policies,
-            "validation_errors": validation_result.validation_errors,
-            "validation_warnings": validation_result.validation_warnings
-        }
+        validation_result = await self.run_mcp_validations(patient_data, view)
+        case_state.metadata["clinical_validation"] = asdict(validation_result)
 
         logger.info(
             "Intake complete",
@@ -123,7 +278,11 @@ class IntakeAgent:
 
         return case_state
 
-    async def run_mcp_validations(self, patient_data: Dict[str, Any]) -> ValidationResult:
+    async def run_mcp_validations(
+        self,
+        patient_data: Dict[str, Any],
+        view: Optional[Dict[str, Any]] = None
+    ) -> ValidationResult:
         """
         Run external validations for patient data.
 
@@ -136,59 +295,155 @@ class IntakeAgent:
 
         Args:
             patient_data: Patient data dictionary
+            view: Normalized view of patient_data, if already computed
 
         Returns:
             ValidationResult with all validation outcomes
         """
-        import asyncio
-        from backend.mcp.npi_validator import get_npi_validator
-        from backend.mcp.icd10_validator import get_icd10_validator
-        from backend.mcp.cms_coverage import get_cms_coverage_client
+        view = view or _normalize_patient_data(patient_data)
+        medication = view["medication"]
 
-        result = ValidationResult()
-
-        # Get relevant data from patient record - support both data structures
-        prescriber = patient_data.get("prescriber", {})
-        diagnoses = patient_data.get("diagnoses") or patient_data.get("clinical_profile", {}).get("diagnoses", [])
-        medication = patient_data.get("medication_request", {})
-
-        npi = prescriber.get("npi")
-        diagnosis_codes = [d.get("icd10_code") for d in diagnoses if d.get("icd10_code")]
+        npi = view["prescriber"].get("npi")
+        # Repeated codes (e.g. primary and secondary entries) are validated once
+        diagnosis_codes = list(dict.fromkeys(view["diagnosis_codes"]))
         medication_name = medication.get("medication_name")
 
         # Get primary ICD-10 from medication_request or diagnoses
-        primary_icd10 = medication.get("icd10_code")
-        if not primary_icd10 and diagnoses:
-            primary_diag = next((d for d in diagnoses if d.get("rank") == "primary"), diagnoses[0] if diagnoses else {})
-            primary_icd10 = primary_diag.get("icd10_code")
+        primary_icd10 = medication.get("icd10_code") or view["primary_diagnosis"].get("icd10_code")
+
+        # Repeat intakes with identical validation inputs reuse the last complete result.
+        # Concurrent identical intakes share one run, which a cancelled intake leaves running.
+        key = (npi, tuple(diagnosis_codes), medication_name, primary_icd10)
+        result, _ = await self._validation_results.get_or_compute(
+            key,
+            lambda: self._run_validations(npi, diagnosis_codes, medication_name, primary_icd10),
+            cache_if=lambda entry: entry[1]
+        )
+        return copy.deepcopy(result)
 
-        # Build concurrent validation tasks
+    async def _run_validations(
+        self,
+        npi: Optional[str],
+        diagnosis_codes: List[str],
+        medication_name: Optional[str],
+        primary_icd10: Optional[str]
+    ) -> Tuple[ValidationResult, bool]:
+        """Fan out the MCP validations.
+
+        Returns the result and whether it is complete, i.e. free of timeouts
+        and service failures and therefore safe to reuse.
+        """
+        result = ValidationResult()
+        complete = True
+
+        # Build concurrent validation tasks, only for inputs that are present
         # NOTE: Only run fast API-based validations (NPI, ICD-10, CMS) during intake.
         # Slow LLM-based validations (HCPCS, cross-verification) are handled by the
         # dedicated /validate/patient/{patient_id} endpoint called from the frontend.
-        async def _npi_task():
-            if not npi:
-                return
-            npi_validator = get_npi_validator()
-            npi_result = await npi_validator.validate_npi(npi)
-            result.npi_valid = npi_result.is_valid
-            result.npi_details = {
+        task_names: List[str] = []
+        tasks = []
+        if npi:
+            if _npi_luhn_ok(str(npi)):
+                task_names.append("NPI")
+                tasks.append(self._validate_npi(get_npi_validator(), npi))
+            else:
+                # Structurally invalid - the registry cannot match it, skip the network call
+                result.npi_valid = False
+                result.validation_errors.append("NPI failed Luhn check")
+        if diagnosis_codes:
+            task_names.append("ICD-10")
+            tasks.append(self._validate_icd10(get_icd10_validator(), diagnosis_codes))
+        if medication_name:
+            icd10_for_search = [primary_icd10] if primary_icd10 else diagnosis_codes[:3]
+            task_names.append("CMS")
+            tasks.append(self._search_cms(get_cms_coverage_client(), medication_name, icd10_for_search))
+
+        # Run API-based validations concurrently, catching individual failures
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for name, outcome in zip(task_names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"{name} validation failed", error=str(outcome))
+                result.validation_warnings.append(f"{name} validation unavailable: {str(outcome)}")
+                complete = False
+                continue
+            if outcome.pop("degraded", False):
+                complete = False
+            for key, value in outcome.items():
+                if key in ("validation_errors", "validation_warnings"):
+                    getattr(result, key).extend(value)
+                else:
+                    setattr(result, key, value)
+
+        return result, complete
+
+    async def _mcp_call(self, call: Awaitable[T], timeout: float) -> T:
+        """Await an MCP call under the shared concurrency bound.
+
+        The timeout covers the call itself, not time spent queued on the
+        semaphore, so a hung server surfaces as asyncio.TimeoutError.
+        """
+        async with self._mcp_semaphore:
+            return await asyncio.wait_for(call, timeout=timeout)
+
+    async def _validate_npi(self, npi_validator: Any, npi: str) -> Dict[str, Any]:
+        """Validate the prescriber NPI. Returns a partial ValidationResult update."""
+        timeout = get_settings().mcp_npi_timeout_seconds
+        try:
+            npi_result = await _validation_cache.get_or_compute(
+                ("npi", npi), lambda: self._mcp_call(npi_validator.validate_npi(npi), timeout), cache_if=_is_definitive
+            )
+        except asyncio.TimeoutError:
+            logger.warning("NPI validation timed out", npi=npi, timeout=timeout)
+            return {"validation_warnings": [f"NPI validation timed out after {timeout}s"], "degraded": True}
+        logger.info("NPI validation complete", npi=npi, valid=npi_result.is_valid)
+        return {
+            "npi_valid": npi_result.is_valid,
+            "npi_details": {
                 "npi": npi_result.npi,
                 "provider_name": npi_result.provider_name,
                 "specialty": npi_result.specialty,
                 "status": npi_result.status
-            }
-            if not npi_result.is_valid:
-                result.validation_errors.extend(npi_result.errors)
-            logger.info("NPI validation complete", npi=npi, valid=npi_result.is_valid)
-
-        async def _icd10_task():
-            if not diagnosis_codes:
-                return
-            icd10_validator = get_icd10_validator()
-            icd10_result = await icd10_validator.validate_batch(diagnosis_codes)
-            result.icd10_valid = icd10_result.all_valid
-            result.icd10_details = [
+            },
+            "validation_errors": [] if npi_result.is_valid else npi_result.errors,
+            "degraded": not _is_definitive(npi_result)
+        }
+
+    async def _validate_icd10(self, icd10_validator: Any, codes: List[str]) -> Dict[str, Any]:
+        """Validate diagnosis codes. Returns a partial ValidationResult update.
+
+        Codes are cached individually so a partially-seen batch only pays for
+        the codes it has not validated recently.
+        """
+        timeout = get_settings().mcp_icd10_timeout_seconds
+        lookups = await asyncio.gather(
+            *(
+                _validation_cache.get_or_compute(
+                    ("icd10", code),
+                    lambda code=code: self._mcp_call(icd10_validator.validate_code(code), timeout),
+                    cache_if=_is_definitive
+                )
+                for code in codes
+            ),
+            return_exceptions=True
+        )
+        timed_out = [code for code, lookup in zip(codes, lookups) if isinstance(lookup, asyncio.TimeoutError)]
+        icd10_result = ICD10ValidationResult.from_codes([
+            ICD10CodeInfo(code=code, is_valid=False, errors=[
+                f"Validation error: timed out after {timeout}s" if code in timed_out else f"Validation error: {str(lookup)}"
+            ])
+            if isinstance(lookup, BaseException) else lookup
+            for code, lookup in zip(codes, lookups)
+        ])
+        logger.info(
+            "ICD-10 validation complete",
+            codes=len(codes),
+            valid=icd10_result.valid_count,
+            invalid=icd10_result.invalid_count
+        )
+        return {
+            "icd10_valid": icd10_result.all_valid,
+            "icd10_details": [
                 {
                     "code": c.code,
                     "valid": c.is_valid,
@@ -196,27 +451,33 @@ class IntakeAgent:
                     "category": c.category
                 }
                 for c in icd10_result.codes
-            ]
-            if not icd10_result.all_valid:
-                result.validation_errors.extend(icd10_result.errors)
-            logger.info(
-                "ICD-10 validation complete",
-                codes=len(diagnosis_codes),
-                valid=icd10_result.valid_count,
-                invalid=icd10_result.invalid_count
-            )
+            ],
+            "validation_errors": [] if icd10_result.all_valid else icd10_result.errors,
+            "validation_warnings": [
+                f"ICD-10 validation timed out after {timeout}s for {code}" for code in timed_out
+            ],
+            "degraded": not all(_is_definitive(c) for c in icd10_result.codes)
+        }
 
-        async def _cms_task():
-            if not medication_name:
-                return
-            cms_client = get_cms_coverage_client()
-            icd10_for_search = [primary_icd10] if primary_icd10 else diagnosis_codes[:3]
-            cms_result = await cms_client.search_coverage(
-                medication_name=medication_name,
-                icd10_codes=icd10_for_search
+    async def _search_cms(self, cms_client: Any, medication_name: str, icd10_codes: List[str]) -> Dict[str, Any]:
+        """Search CMS coverage policies. Returns a partial ValidationResult update."""
+        timeout = get_settings().mcp_cms_timeout_seconds
+        try:
+            cms_result = await self._mcp_call(
+                cms_client.search_coverage(medication_name=medication_name, icd10_codes=icd10_codes),
+                timeout
             )
-            result.cms_coverage_found = cms_result.total_found > 0
-            result.cms_policies = [
+        except asyncio.TimeoutError:
+            logger.warning("CMS coverage search timed out", medication=medication_name, timeout=timeout)
+            return {"validation_warnings": [f"CMS validation timed out after {timeout}s"], "degraded": True}
+        logger.info(
+            "CMS coverage search complete",
+            medication=medication_name,
+            policies_found=cms_result.total_found
+        )
+        return {
+            "cms_coverage_found": cms_result.total_found > 0,
+            "cms_policies": [
                 {
                     "policy_id": p.policy_id,
                     "title": p.title,
@@ -225,173 +486,135 @@ class IntakeAgent:
                     "limitations": p.limitations
                 }
                 for p in cms_result.policies
-            ]
-            if cms_result.errors:
-                result.validation_warnings.extend(cms_result.errors)
-            logger.info(
-                "CMS coverage search complete",
-                medication=medication_name,
-                policies_found=cms_result.total_found
-            )
-
-        # Run API-based validations concurrently, catching individual failures
-        task_funcs = [_npi_task, _icd10_task, _cms_task]
-        task_names = ["NPI", "ICD-10", "CMS"]
-
-        outcomes = await asyncio.gather(
-            *[fn() for fn in task_funcs],
-            return_exceptions=True
-        )
-
-        for name, outcome in zip(task_names, outcomes):
-            if isinstance(outcome, Exception):
-                logger.warning(f"{name} validation failed", error=str(outcome))
-                result.validation_warnings.append(f"{name} validation unavailable: {str(outcome)}")
-
-        return result
+            ],
+            "validation_warnings": cms_result.errors or [],
+            "degraded": bool(cms_result.errors)
+        }
 
-    async def load_patient_data(self, patient_id: str) -> Dict[str, Any]:
+    async def load_patient_data(self, patient_id: str, keys: Optional[frozenset] = None) -> Dict[str, Any]:
         """
         Load patient data from file.
 
         Args:
             patient_id: Patient identifier
+            keys: Top-level keys the caller needs. When given, files above the
+                stream threshold are parsed incrementally and only these keys kept.
 
         Returns:
             Patient data dictionary
         """
         file_path = self.patients_dir / f"{patient_id}.json"
+        threshold = get_settings().patient_json_stream_threshold_bytes
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Patient data not found: {patient_id}")
-
-        import asyncio
-
-        def _read_json():
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-
-        data = await asyncio.to_thread(_read_json)
+        # No separate exists() probe - a missing file surfaces from stat/open
+        try:
+            if keys is not None and (await aiofiles.os.stat(file_path)).st_size > threshold:
+                data = await self._stream_patient_keys(file_path, keys)
+            else:
+                async with aiofiles.open(file_path, "rb") as f:
+                    raw = await f.read()
+                data = orjson.loads(raw)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Patient data not found: {patient_id}") from None
 
         logger.debug("Patient data loaded", patient_id=patient_id)
         return data
 
-    def validate_patient_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _stream_patient_keys(self, file_path: Path, keys: frozenset) -> Dict[str, Any]:
+        """Incrementally parse a patient file, keeping only the given top-level keys."""
+        data = {}
+        async with aiofiles.open(file_path, "rb") as f:
+            async for key, value in ijson.kvitems_async(f, "", use_float=True):
+                if key in keys:
+                    data[key] = value
+        return data
+
+    def validate_patient_data(
+        self,
+        data: Dict[str, Any],
+        view: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Validate patient data completeness.
 
         Args:
             data: Patient data dictionary
+            view: Normalized view of data, if already computed
 
         Returns:
             Validation result with errors if any
         """
         errors = []
         warnings = []
+        view = view or _normalize_patient_data(data)
 
-        # Required demographics
-        demographics = data.get("demographics", {})
-        required_demo_fields = ["first_name", "last_name", "date_of_birth"]
-        for field in required_demo_fields:
-            if not demographics.get(field):
-                errors.append(f"Missing required field: demographics.{field}")
-
-        # Required insurance
-        insurance = data.get("insurance", {})
-        if not insurance.get("primary"):
-            errors.append("Missing primary insurance information")
-        else:
-            primary = insurance["primary"]
-            if not primary.get("payer_name"):
-                errors.append("Missing primary payer name")
-            if not primary.get("member_id"):
-                errors.append("Missing primary member ID")
-
-        # Required diagnoses - check both root level and clinical_profile (backwards compat)
-        diagnoses = data.get("diagnoses") or data.get("clinical_profile", {}).get("diagnoses")
-        if not diagnoses:
-            errors.append("Missing diagnosis information")
-
-        # Required medication request
-        medication = data.get("medication_request", {})
-        required_med_fields = ["medication_name", "dose"]
-        for field in required_med_fields:
-            if not medication.get(field):
-                errors.append(f"Missing required field: medication_request.{field}")
+        # Required demographics, insurance, diagnoses, medication request and prescriber
+        missing = set()
+        for parts, label in _REQUIRED_FIELD_SPECS:
+            if parts[:-1] in missing:
+                continue
+            if not _dig(view, parts):
+                missing.add(parts)
+                errors.append(label)
 
         # Check diagnosis info - can be in medication_request or derived from diagnoses
+        medication = view["medication"]
         if not medication.get("diagnosis") and not medication.get("indication"):
             # Try to derive from primary diagnosis
-            if diagnoses and len(diagnoses) > 0:
-                primary_diag = next((d for d in diagnoses if d.get("rank") == "primary"), diagnoses[0])
-                if not primary_diag.get("description"):
+            if view["diagnoses"]:
+                if not view["primary_diagnosis"].get("description"):
                     errors.append("Missing diagnosis description in medication_request or diagnoses")
             else:
                 errors.append("Missing diagnosis information for medication request")
 
-        # Required prescriber
-        prescriber = data.get("prescriber", {})
-        if not prescriber.get("npi"):
-            errors.append("Missing prescriber NPI")
+        npi = view["prescriber"].get("npi")
+        if npi and not _npi_luhn_ok(str(npi)):
+            warnings.append("Prescriber NPI fails check-digit validation - registry lookup will fail")
 
-        # Warnings (non-blocking) - check root level and clinical_profile
-        lab_results = data.get("laboratory_results") or data.get("lab_results") or data.get("clinical_profile", {}).get("lab_results")
-        if not lab_results:
+        # Warnings (non-blocking)
+        if not view["lab_results"]:
             warnings.append("No lab results provided - may be required for PA")
 
-        prior_treatments = data.get("prior_treatments") or data.get("clinical_profile", {}).get("prior_treatments")
-        if not prior_treatments:
+        if not view["prior_treatments"]:
             warnings.append("No prior treatment history - step therapy may fail")
 
         return {
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
-            "fields_validated": len(required_demo_fields) + len(required_med_fields) + 4
+            "fields_validated": len(_REQUIRED_FIELD_SPECS) + 1
         }
 
-    def _build_patient_info(self, data: Dict[str, Any]) -> PatientInfo:
-        """Build PatientInfo from patient data."""
-        demographics = data.get("demographics", {})
-        insurance = data.get("insurance", {})
-
-        # Support both root-level and clinical_profile structures
-        diagnoses = data.get("diagnoses") or data.get("clinical_profile", {}).get("diagnoses", [])
-        allergies = data.get("allergies") or data.get("clinical_profile", {}).get("allergies", [])
-        contraindications = data.get("contraindications") or data.get("clinical_profile", {}).get("contraindications", [])
-
-        primary = insurance.get("primary", {})
-        secondary = insurance.get("secondary", {})
+    def _build_patient_info(self, view: Dict[str, Any]) -> PatientInfo:
+        """Build PatientInfo from the normalized patient view."""
+        first_name, last_name, date_of_birth = _get_demographics({**_DEMOGRAPHIC_DEFAULTS, **view["demographics"]})
+        primary = view["insurance_primary"]
+        secondary = view["insurance_secondary"]
 
         return PatientInfo(
-            patient_id=data.get("patient_id", "unknown"),
-            first_name=demographics.get("first_name", ""),
-            last_name=demographics.get("last_name", ""),
-            date_of_birth=demographics.get("date_of_birth", ""),
+            patient_id=view["patient_id"],
+            first_name=first_name,
+            last_name=last_name,
+            date_of_birth=date_of_birth,
             primary_payer=primary.get("payer_name", ""),
             primary_member_id=primary.get("member_id", ""),
             secondary_payer=secondary.get("payer_name") if secondary else None,
             secondary_member_id=secondary.get("member_id") if secondary else None,
-            diagnosis_codes=[d.get("icd10_code", "") for d in diagnoses],
-            allergies=[a.get("allergen", "") for a in allergies],
-            contraindications=contraindications
+            diagnosis_codes=list(view["diagnosis_codes"]),
+            allergies=[allergen for a in view["allergies"] if (allergen := a.get("allergen"))],
+            contraindications=view["contraindications"]
         )
 
-    def _build_medication_request(self, data: Dict[str, Any]) -> MedicationRequest:
-        """Build MedicationRequest from patient data."""
-        med = data.get("medication_request", {})
-        prescriber = data.get("prescriber", {})
-
-        # Support both root-level and clinical_profile structures
-        diagnoses = data.get("diagnoses") or data.get("clinical_profile", {}).get("diagnoses", [])
-        prior_treatments = data.get("prior_treatments") or data.get("clinical_profile", {}).get("prior_treatments", [])
-        lab_results = data.get("laboratory_results") or data.get("lab_results") or data.get("clinical_profile", {}).get("lab_results", [])
+    def _build_medication_request(self, view: Dict[str, Any]) -> MedicationRequest:
+        """Build MedicationRequest from the normalized patient view."""
+        med = view["medication"]
+        prescriber = view["prescriber"]
 
         # Get diagnosis from medication_request or derive from primary diagnosis
         diagnosis = med.get("diagnosis") or med.get("indication", "")
         icd10_code = med.get("icd10_code", "")
-        if (not diagnosis or not icd10_code) and diagnoses:
-            primary_diag = next((d for d in diagnoses if d.get("rank") == "primary"), diagnoses[0] if diagnoses else {})
+        if (not diagnosis or not icd10_code) and view["diagnoses"]:
+            primary_diag = view["primary_diagnosis"]
             if not diagnosis:
                 diagnosis = primary_diag.get("description", "")
             if not icd10_code:
@@ -421,45 +644,36 @@ class IntakeAgent:
             prescriber_npi=prescriber.get("npi", ""),
             prescriber_name=prescriber.get("name", ""),
             clinical_rationale=med.get("clinical_rationale", ""),
-            prior_treatments=prior_treatments,
-            supporting_labs=lab_results
+            prior_treatments=view["prior_treatments"],
+            supporting_labs=view["lab_results"]
         )
 
-    def _initialize_payer_states(self, data: Dict[str, Any]) -> Dict[str, PayerState]:
-        """Initialize payer states from insurance data."""
-        insurance = data.get("insurance", {})
+    def _initialize_payer_states(self, view: Dict[str, Any]) -> Dict[str, PayerState]:
+        """Initialize payer states from the normalized insurance data."""
         payer_states = {}
 
-        if insurance.get("primary"):
-            payer_name = insurance["primary"].get("payer_name", "Primary")
-            payer_states[payer_name] = PayerState(
-                payer_name=payer_name,
-                status=PayerStatus.NOT_SUBMITTED
-            )
-
-        if insurance.get("secondary"):
-            payer_name = insurance["secondary"].get("payer_name", "Secondary")
-            payer_states[payer_name] = PayerState(
-                payer_name=payer_name,
-                status=PayerStatus.NOT_SUBMITTED
-            )
+        for slot, default_name in _PAYER_SLOTS:
+            coverage = view[slot]
+            if coverage:
+                payer_name = coverage.get("payer_name", default_name)
+                payer_states[payer_name] = PayerState(
+                    payer_name=payer_name,
+                    status=PayerStatus.NOT_SUBMITTED
+                )
 
         return payer_states
 
     def _generate_case_id(self, patient_id: str) -> str:
-        """Generate a unique case ID."""
-        from uuid import uuid4
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d")
-        return f"CASE-{timestamp}-{str(uuid4())[:8].upper()}"
-
-
-# Global instance
-_intake_agent: Optional[IntakeAgent] = None
+        """Generate a unique case ID (date prefix plus 32 random bits)."""
+        now = datetime.now(timezone.utc)
+        day = now.toordinal()
+        if _CASE_ID_DATE["day"] != day:
+            _CASE_ID_DATE["day"] = day
+            _CASE_ID_DATE["str"] = now.strftime("%Y%m%d")
+        return f"CASE-{_CASE_ID_DATE['str']}-{os.urandom(4).hex().upper()}"
 
 
+@lru_cache
 def get_intake_agent() -> IntakeAgent:
     """Get or create the global intake agent."""
-    global _intake_agent
-    if _intake_agent is None:
-        _intake_agent = IntakeAgent()
-    return _intake_agent
+    return IntakeAgent()
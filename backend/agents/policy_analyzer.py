@@ -1,26 +1,119 @@
 """Policy analyzer agent with iterative refinement for coverage assessment."""
-import json
+import asyncio
+import hashlib
+import os
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 
-from backend.models.coverage import CoverageAssessment, CriterionAssessment
+import orjson
+from pydantic import TypeAdapter
+
+from backend.models.coverage import CoverageAssessment, CriterionAssessment, DocumentationGap
 from backend.models.case_state import CaseState
+from backend.models.enums import CoverageStatus
 from backend.reasoning.policy_reasoner import get_policy_reasoner
 from backend.storage.waypoint_writer import get_waypoint_writer
 from backend.config.logging_config import get_logger
 from backend.config.settings import get_settings
+from backend.utils.ttl_cache import AsyncTTLCache
 
 logger = get_logger(__name__)
 
 PATIENTS_DIR = Path(get_settings().patients_dir)
+# Plain-string form for the hot loaders, which skip pathlib joins per call
+_PATIENTS_DIR_STR = str(PATIENTS_DIR)
 
 # Confidence threshold below which criteria trigger targeted re-evaluation
 LOW_CONFIDENCE_THRESHOLD = 0.7
 
+# Under the "outcome_affecting" refinement policy, a criterion already judged met
+# is only re-evaluated when its confidence falls below this stricter threshold
+MET_CRITERION_REFINEMENT_THRESHOLD = 0.5
+
 # Maximum refinement iterations to prevent unbounded loops
 MAX_REFINEMENT_ITERATIONS = 2
 
+# Low-confidence criteria are split into up to this many disjoint groups per
+# iteration, each re-evaluated by its own concurrent assessment
+REFINEMENT_PARALLEL_GROUPS = 2
+
+# Raw patient record sections copied into the reasoner's patient context
+_RAW_ENRICHMENT_KEYS = frozenset({
+    "pre_biologic_screening", "disease_activity", "clinical_history",
+    "laboratory_results", "procedures", "documentation_gaps",
+    "diagnoses", "prior_treatments",
+})
+
+# MedicationRequest fields passed to the reasoner, in prompt order
+_MEDICATION_FIELDS = (
+    "medication_name", "generic_name", "ndc_code", "dose", "frequency", "route",
+    "duration", "diagnosis", "icd10_code", "prescriber_npi", "prescriber_name",
+    "clinical_rationale",
+)
+
+# DocumentationGap fields included in the cross-payer gap summary
+_GAP_SUMMARY_FIELDS = ("gap_id", "gap_type", "description", "priority", "required_for", "suggested_action")
+
+# Plain string value per coverage status, resolved once instead of via .value per use
+_STATUS_VALUE = {status: status.value for status in CoverageStatus}
+
+# Waypoint AI recommendation by best coverage status; anything else needs human review
+_STATUS_RECOMMENDATION = {
+    "covered": "APPROVE",
+    "likely_covered": "APPROVE",
+    "requires_pa": "PEND",
+    "conditional": "PEND",
+    "pend": "PEND",
+}
+
+# Serializer for a payer's gap list, with its schema compiled once at import
+_GAP_LIST_ADAPTER = TypeAdapter(List[DocumentationGap])
+
+# Sort rank for documentation gap priorities; unknown priorities sort last
+_GAP_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# Pretty-printed like json.dumps(indent=2) for prompt variables; unknown types fall back to str()
+_PROMPT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _prompt_json(obj: Any) -> str:
+    """Serialize a prompt variable as indented JSON text."""
+    return orjson.dumps(obj, default=str, option=_PROMPT_JSON_OPTIONS).decode()
+
+
+# Per-case reasoner contexts, reused while the case version is unchanged
+_CONTEXT_CACHE_TTL = 300  # seconds
+_CONTEXT_CACHE_SIZE = 256
+
+# Evidence gap scan results, keyed on a digest of the rendered prompt
+_EVIDENCE_GAP_CACHE_TTL = 900  # seconds
+_EVIDENCE_GAP_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=512)
+def _read_patient_file(patient_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a patient file; keyed on mtime so an edited file is re-read.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    with open(patient_file, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _load_patient_file(patient_id: str) -> Optional[Dict[str, Any]]:
+    """Load a raw patient file through the mtime-keyed cache; None if missing or unreadable."""
+    patient_file = f"{_PATIENTS_DIR_STR}/{patient_id}.json"
+    try:
+        return _read_patient_file(patient_file, os.stat(patient_file).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Could not load raw patient data", patient_id=patient_id, error=str(e))
+        return None
+
 
 class PolicyAnalyzerAgent:
     """
@@ -41,7 +134,13 @@ class PolicyAnalyzerAgent:
         Args:
             write_waypoints: Whether to write waypoint files (default True)
         """
+        settings = get_settings()
         self.reasoner = get_policy_reasoner()
+        # Bounds every LLM call from this agent (shared by the singleton) to respect provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(settings.max_concurrent_llm_calls)
+        self._refine_outcome_affecting_only = settings.refinement_policy == "outcome_affecting"
+        self._context_cache = AsyncTTLCache(maxsize=_CONTEXT_CACHE_SIZE, default_ttl=_CONTEXT_CACHE_TTL)
+        self._evidence_gap_cache = AsyncTTLCache(maxsize=_EVIDENCE_GAP_CACHE_SIZE, default_ttl=_EVIDENCE_GAP_CACHE_TTL)
         self.write_waypoints = write_waypoints
         self.waypoint_writer = get_waypoint_writer() if write_waypoints else None
         logger.info("Policy analyzer agent initialized", waypoints=write_waypoints)
@@ -66,52 +165,45 @@ class PolicyAnalyzerAgent:
         logger.info("Analyzing all payers", case_id=case_state.case_id)
 
         assessments = {}
-        patient = case_state.patient
-        medication = case_state.medication
+        patient_info, medication_info, raw_patient = await self._build_contexts(case_state)
 
-        if not patient or not medication:
-            raise ValueError("Patient and medication data required for analysis")
+        # --- Step 1: Evidence gap detection (LLM-first) ---
+        # Only refinement consumes the warnings, so the scan runs alongside the
+        # initial payer assessments instead of ahead of them.
+        gap_task = asyncio.create_task(self._detect_evidence_gaps(patient_info, raw_patient))
 
-        # Build data structures for analysis
-        patient_info = {
-            "patient_id": patient.patient_id,
-            "name": f"{patient.first_name} {patient.last_name}",
-            "date_of_birth": patient.date_of_birth,
-            "diagnosis_codes": patient.diagnosis_codes,
-            "allergies": patient.allergies,
-            "contraindications": patient.contraindications,
-            "prior_treatments": medication.prior_treatments,
-            "lab_results": medication.supporting_labs,
-        }
+        # --- Step 2 & 3: Assess all payers concurrently ---
+        payers_to_analyze = list(case_state.payer_states.keys())
 
-        # Enrich with full clinical context from patient data file
-        raw_patient = self._load_raw_patient_data(patient.patient_id)
-        if raw_patient:
-            for key in (
-                "pre_biologic_screening", "disease_activity", "clinical_history",
-                "laboratory_results", "procedures", "documentation_gaps",
-                "diagnoses", "prior_treatments",
-            ):
-                if key in raw_patient and key not in patient_info:
-                    patient_info[key] = raw_patient[key]
-
-        medication_info = {
-            "medication_name": medication.medication_name,
-            "generic_name": medication.generic_name,
-            "ndc_code": medication.ndc_code,
-            "dose": medication.dose,
-            "frequency": medication.frequency,
-            "route": medication.route,
-            "duration": medication.duration,
-            "diagnosis": medication.diagnosis,
-            "icd10_code": medication.icd10_code,
-            "prescriber_npi": medication.prescriber_npi,
-            "prescriber_name": medication.prescriber_name,
-            "clinical_rationale": medication.clinical_rationale
-        }
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._analyze_payer(
+                        payer_name=payer_name,
+                        patient_info=patient_info,
+                        medication_info=medication_info,
+                        evidence_task=gap_task,
+                    )
+                    for payer_name in payers_to_analyze
+                ),
+                return_exceptions=True
+            )
+        except BaseException:
+            gap_task.cancel()
+            raise
 
-        # --- Step 1: Evidence gap detection (LLM-first) ---
-        evidence_warnings = await self._detect_evidence_gaps(patient_info, raw_patient)
+        for payer_name, result in zip(payers_to_analyze, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Payer analysis failed",
+                    payer=payer_name,
+                    error=str(result)
+                )
+                gap_task.cancel()
+                # Don't swallow error - policy analysis is critical
+                raise result
+
+        evidence_warnings = await gap_task
         if evidence_warnings:
             gap_summary = "; ".join(evidence_warnings)
             reasoning_chain.append(
@@ -128,62 +220,10 @@ class PolicyAnalyzerAgent:
                 "[PolicyAnalyzer] Evidence gap scan: no documentation issues detected"
             )
 
-        # --- Step 2: Initial assessment per payer ---
-        payers_to_analyze = list(case_state.payer_states.keys())
-
-        for payer_name in payers_to_analyze:
-            try:
-                reasoning_chain.append(
-                    f"[PolicyAnalyzer] Running initial coverage assessment for {payer_name}"
-                )
-
-                assessment = await self.reasoner.assess_coverage(
-                    patient_info=patient_info,
-                    medication_info=medication_info,
-                    payer_name=payer_name
-                )
-
-                logger.info(
-                    "Initial payer analysis complete",
-                    payer=payer_name,
-                    status=assessment.coverage_status.value,
-                    likelihood=assessment.approval_likelihood,
-                )
-
-                reasoning_chain.append(
-                    f"[PolicyAnalyzer] {payer_name} initial result: "
-                    f"status={assessment.coverage_status.value}, "
-                    f"likelihood={assessment.approval_likelihood:.0%}, "
-                    f"criteria={assessment.criteria_met_count}/{assessment.criteria_total_count}"
-                )
-
-                # --- Step 3: Iterative refinement for low-confidence criteria ---
-                assessment = await self._iterative_refinement(
-                    assessment=assessment,
-                    patient_info=patient_info,
-                    medication_info=medication_info,
-                    payer_name=payer_name,
-                    evidence_warnings=evidence_warnings,
-                    reasoning_chain=reasoning_chain,
-                )
-
-                assessments[payer_name] = assessment
-
-                logger.info(
-                    "Payer analysis complete (post-refinement)",
-                    payer=payer_name,
-                    status=assessment.coverage_status.value,
-                    likelihood=assessment.approval_likelihood,
-                )
-
-            except Exception as e:
-                logger.error(
-                    "Payer analysis failed",
-                    payer=payer_name,
-                    error=str(e)
-                )
-                # Don't swallow error - policy analysis is critical
-                raise
+        for payer_name, (assessment, payer_chain) in zip(payers_to_analyze, results):
+            assessments[payer_name] = assessment
+            # Per-payer chains are appended in payer order so the audit trail stays deterministic
+            reasoning_chain.extend(payer_chain)
 
         # --- Step 4: Log final reasoning chain ---
         reasoning_chain.append(
@@ -191,8 +231,9 @@ class PolicyAnalyzerAgent:
         )
 
         # Attach reasoning chain to case_state messages if available
-        if hasattr(case_state, 'messages') and isinstance(getattr(case_state, 'messages', None), list):
-            case_state.messages.extend(reasoning_chain)
+        messages = getattr(case_state, "messages", None)
+        if isinstance(messages, list):
+            messages.extend(reasoning_chain)
 
         # Store reasoning chain on the assessments for downstream consumers
         for payer_name, assessment in assessments.items():
@@ -209,7 +250,7 @@ class PolicyAnalyzerAgent:
         # Write assessment waypoint if enabled
         if self.write_waypoints and self.waypoint_writer and assessments:
             try:
-                self._write_assessment_waypoint(
+                await self._write_assessment_waypoint(
                     case_state=case_state,
                     assessments=assessments,
                     patient_info=patient_info,
@@ -220,6 +261,119 @@ class PolicyAnalyzerAgent:
 
         return assessments
 
+    async def _build_contexts(
+        self,
+        case_state: CaseState
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Build the patient and medication contexts passed to the policy reasoner.
+
+        Contexts are cached per (case_id, version), so repeated analyses of an
+        unchanged case reuse them. The returned dicts must be treated as read-only.
+
+        Returns:
+            Tuple of (patient_info, medication_info, raw_patient)
+
+        Raises:
+            ValueError: If the case has no patient or medication data
+        """
+        patient = case_state.patient
+        medication = case_state.medication
+
+        if not patient or not medication:
+            raise ValueError("Patient and medication data required for analysis")
+
+        cache_key = (case_state.case_id, case_state.version)
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        patient_info = {
+            "patient_id": patient.patient_id,
+            "name": f"{patient.first_name} {patient.last_name}",
+            "date_of_birth": patient.date_of_birth,
+            "diagnosis_codes": patient.diagnosis_codes,
+            "allergies": patient.allergies,
+            "contraindications": patient.contraindications,
+            "prior_treatments": medication.prior_treatments,
+            "lab_results": medication.supporting_labs,
+        }
+
+        # Enrich with full clinical context from patient data file
+        # so the LLM can identify documentation gaps (e.g. TB/Hep B screenings)
+        raw_patient = await self._load_raw_patient_data(patient.patient_id)
+        if raw_patient:
+            # Sorted so the prompt's key order is stable across processes (str hashes are randomized)
+            for key in sorted(_RAW_ENRICHMENT_KEYS & raw_patient.keys() - patient_info.keys()):
+                patient_info[key] = raw_patient[key]
+
+        medication_info = {k: getattr(medication, k) for k in _MEDICATION_FIELDS}
+
+        contexts = (patient_info, medication_info, raw_patient)
+        self._context_cache.set(cache_key, contexts)
+        return contexts
+
+    async def _analyze_payer(
+        self,
+        payer_name: str,
+        patient_info: Dict[str, Any],
+        medication_info: Dict[str, Any],
+        evidence_task: "asyncio.Task[List[str]]",
+    ) -> Tuple[CoverageAssessment, List[str]]:
+        """
+        Run the initial assessment and iterative refinement for one payer.
+
+        The evidence gap scan is awaited only once refinement needs its warnings.
+
+        Returns:
+            The refined assessment and the payer's reasoning chain entries
+        """
+        reasoning_chain: List[str] = [
+            f"[PolicyAnalyzer] Running initial coverage assessment for {payer_name}"
+        ]
+
+        async with self._llm_semaphore:
+            assessment = await self.reasoner.assess_coverage(
+                patient_info=patient_info,
+                medication_info=medication_info,
+                payer_name=payer_name
+            )
+
+        logger.info(
+            "Initial payer analysis complete",
+            payer=payer_name,
+            status=_STATUS_VALUE[assessment.coverage_status],
+            likelihood=assessment.approval_likelihood,
+        )
+
+        reasoning_chain.append(
+            f"[PolicyAnalyzer] {payer_name} initial result: "
+            f"status={_STATUS_VALUE[assessment.coverage_status]}, "
+            f"likelihood={assessment.approval_likelihood:.0%}, "
+            f"criteria={assessment.criteria_met_count}/{assessment.criteria_total_count}"
+        )
+
+        # --- Step 3: Iterative refinement for low-confidence criteria ---
+        # Shielded so one payer being cancelled does not cancel the shared scan
+        evidence_warnings = await asyncio.shield(evidence_task)
+        assessment = await self._iterative_refinement(
+            assessment=assessment,
+            patient_info=patient_info,
+            medication_info=medication_info,
+            payer_name=payer_name,
+            evidence_warnings=evidence_warnings,
+            reasoning_chain=reasoning_chain,
+        )
+
+        logger.info(
+            "Payer analysis complete (post-refinement)",
+            payer=payer_name,
+            status=_STATUS_VALUE[assessment.coverage_status],
+            likelihood=assessment.approval_likelihood,
+        )
+
+        return assessment, reasoning_chain
+
     # ------------------------------------------------------------------
     # Evidence gap detection
     # ------------------------------------------------------------------
@@ -234,31 +388,44 @@ class PolicyAnalyzerAgent:
 
         Uses the evidence_gap_detection prompt to identify missing labs,
         pending screenings, outdated records, and known documentation gaps.
+        Results are cached on a digest of the rendered prompt, so identical
+        patient data skips the LLM call.
 
         Returns:
             List of human-readable warning strings for the reasoning chain.
         """
-        from backend.models.enums import TaskCategory
-        from backend.reasoning.llm_gateway import get_llm_gateway
         from backend.reasoning.prompt_loader import get_prompt_loader
 
         prompt_loader = get_prompt_loader()
-        llm_gateway = get_llm_gateway()
 
         prompt = prompt_loader.load(
             "policy_analysis/evidence_gap_detection.txt",
             {
-                "patient_info": json.dumps(patient_info, indent=2, default=str),
-                "raw_patient": json.dumps(raw_patient, indent=2, default=str) if raw_patient else "No raw patient record available",
+                "patient_info": _prompt_json(patient_info),
+                "raw_patient": _prompt_json(raw_patient) if raw_patient else "No raw patient record available",
             },
         )
 
-        result = await llm_gateway.generate(
-            task_category=TaskCategory.DATA_EXTRACTION,
-            prompt=prompt,
-            temperature=0.0,
-            response_format="json",
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        warnings = await self._evidence_gap_cache.get_or_compute(
+            cache_key, lambda: self._run_evidence_gap_scan(prompt)
         )
+        return list(warnings)
+
+    async def _run_evidence_gap_scan(self, prompt: str) -> Tuple[str, ...]:
+        """Run the evidence gap detection prompt through the LLM gateway."""
+        from backend.models.enums import TaskCategory
+        from backend.reasoning.llm_gateway import get_llm_gateway
+
+        llm_gateway = get_llm_gateway()
+
+        async with self._llm_semaphore:
+            result = await llm_gateway.generate(
+                task_category=TaskCategory.DATA_EXTRACTION,
+                prompt=prompt,
+                temperature=0.0,
+                response_format="json",
+            )
 
         warnings = result.get("evidence_warnings", [])
 
@@ -268,7 +435,7 @@ class PolicyAnalyzerAgent:
             readiness=result.get("overall_readiness", "unknown"),
         )
 
-        return warnings
+        return tuple(warnings)
 
     # ------------------------------------------------------------------
     # Iterative refinement loop
@@ -286,7 +453,8 @@ class PolicyAnalyzerAgent:
         """
         Check for low-confidence criteria and attempt targeted re-evaluation.
 
-        If any criterion in the initial assessment has confidence < LOW_CONFIDENCE_THRESHOLD,
+        If any criterion in the initial assessment has confidence < LOW_CONFIDENCE_THRESHOLD
+        (narrowed by the configured refinement policy, see _needs_refinement),
         triggers a re-assessment with additional context highlighting those specific criteria,
         up to MAX_REFINEMENT_ITERATIONS times.
 
@@ -301,6 +469,14 @@ class PolicyAnalyzerAgent:
         Returns:
             Refined CoverageAssessment (or the original if no refinement needed)
         """
+        # Fast path: a fully confident assessment needs no refinement bookkeeping
+        if not any(map(self._needs_refinement, assessment.criteria_assessments)):
+            reasoning_chain.append(
+                f"[PolicyAnalyzer] {payer_name} refinement iteration 1: "
+                "all criteria above confidence threshold - no refinement needed"
+            )
+            return assessment
+
         current_assessment = assessment
 
         for iteration in range(1, MAX_REFINEMENT_ITERATIONS + 1):
@@ -333,32 +509,61 @@ class PolicyAnalyzerAgent:
                 criteria=criteria_names,
             )
 
-            # Build targeted additional context for the re-evaluation
-            refinement_context = self._build_refinement_context(
-                low_confidence_criteria=low_confidence_criteria,
-                evidence_warnings=evidence_warnings,
-                current_assessment=current_assessment,
-                iteration=iteration,
-            )
+            # Split the targeted criteria into contiguous, disjoint groups
+            group_size = -(-len(low_confidence_criteria) // REFINEMENT_PARALLEL_GROUPS)
+            groups = [
+                low_confidence_criteria[i:i + group_size]
+                for i in range(0, len(low_confidence_criteria), group_size)
+            ]
 
             try:
-                refined_assessment = await self.reasoner.assess_coverage(
-                    patient_info=patient_info,
-                    medication_info=medication_info,
-                    payer_name=payer_name,
-                    skip_cache=True,
-                    historical_context=refinement_context,
-                )
-
-                # Merge: only accept refined criteria if their confidence improved
-                current_assessment = self._merge_refined_assessment(
-                    original=current_assessment,
-                    refined=refined_assessment,
-                    targeted_criteria_names=criteria_names,
-                    reasoning_chain=reasoning_chain,
-                    payer_name=payer_name,
-                    iteration=iteration,
-                )
+                # One targeted re-evaluation per group, all in flight at once. Every
+                # group is awaited, so a failed group neither orphans a sibling's
+                # call nor discards its result.
+                refined_assessments = await asyncio.gather(*(
+                    self._reassess_with_context(
+                        patient_info=patient_info,
+                        medication_info=medication_info,
+                        payer_name=payer_name,
+                        refinement_context=self._build_refinement_context(
+                            low_confidence_criteria=group,
+                            evidence_warnings=evidence_warnings,
+                            current_assessment=current_assessment,
+                            iteration=iteration,
+                        ),
+                    )
+                    for group in groups
+                ), return_exceptions=True)
+
+                # Merge group results in order: only accept refined criteria if their confidence improved
+                group_failed = False
+                for group, refined_assessment in zip(groups, refined_assessments):
+                    if isinstance(refined_assessment, BaseException):
+                        group_failed = True
+                        group_names = [c.criterion_name for c in group]
+                        reasoning_chain.append(
+                            f"[PolicyAnalyzer] {payer_name} refinement iteration {iteration} failed for "
+                            f"{', '.join(group_names)}: {str(refined_assessment)} - keeping original assessment "
+                            "for those criteria"
+                        )
+                        logger.warning(
+                            "Refinement re-evaluation failed for criteria group, keeping original assessment",
+                            payer=payer_name,
+                            iteration=iteration,
+                            criteria=group_names,
+                            error=str(refined_assessment),
+                        )
+                        continue
+                    current_assessment = self._merge_refined_assessment(
+                        original=current_assessment,
+                        refined=refined_assessment,
+                        targeted_criteria_names=frozenset(c.criterion_name for c in group),
+                        reasoning_chain=reasoning_chain,
+                        payer_name=payer_name,
+                        iteration=iteration,
+                    )
+                if group_failed:
+                    break
 
             except Exception as e:
                 reasoning_chain.append(
@@ -375,14 +580,43 @@ class PolicyAnalyzerAgent:
 
         return current_assessment
 
+    async def _reassess_with_context(
+        self,
+        patient_info: Dict[str, Any],
+        medication_info: Dict[str, Any],
+        payer_name: str,
+        refinement_context: str,
+    ) -> CoverageAssessment:
+        """Re-run the coverage assessment with targeted refinement context, bypassing the reasoner cache."""
+        async with self._llm_semaphore:
+            return await self.reasoner.assess_coverage(
+                patient_info=patient_info,
+                medication_info=medication_info,
+                payer_name=payer_name,
+                skip_cache=True,
+                historical_context=refinement_context,
+            )
+
     def _find_low_confidence_criteria(
         self, assessment: CoverageAssessment
     ) -> List[CriterionAssessment]:
-        """Return criteria with confidence below the threshold."""
-        return [
-            c for c in assessment.criteria_assessments
-            if c.confidence < LOW_CONFIDENCE_THRESHOLD
-        ]
+        """Return criteria whose low confidence warrants targeted re-evaluation."""
+        return [c for c in assessment.criteria_assessments if self._needs_refinement(c)]
+
+    def _needs_refinement(self, criterion: CriterionAssessment) -> bool:
+        """
+        Whether a criterion's confidence is low enough to re-evaluate.
+
+        With the "outcome_affecting" policy, met criteria are only retried below
+        MET_CRITERION_REFINEMENT_THRESHOLD, since a confidence bump on a met
+        criterion rarely changes the decision. The "all" policy retries every
+        criterion below LOW_CONFIDENCE_THRESHOLD.
+        """
+        if criterion.confidence >= LOW_CONFIDENCE_THRESHOLD:
+            return False
+        if self._refine_outcome_affecting_only and criterion.is_met:
+            return criterion.confidence < MET_CRITERION_REFINEMENT_THRESHOLD
+        return True
 
     def _build_refinement_context(
         self,
@@ -430,7 +664,7 @@ class PolicyAnalyzerAgent:
         self,
         original: CoverageAssessment,
         refined: CoverageAssessment,
-        targeted_criteria_names: List[str],
+        targeted_criteria_names: FrozenSet[str],
         reasoning_chain: List[str],
         payer_name: str,
         iteration: int,
@@ -479,11 +713,12 @@ class PolicyAnalyzerAgent:
 
         # Use refined overall assessment if any criteria improved
         if improvements > 0:
-            result = refined.model_copy()
-            result.criteria_assessments = merged_criteria
-            result.criteria_met_count = sum(1 for c in merged_criteria if c.is_met)
-            result.criteria_total_count = len(merged_criteria)
-            return result
+            # Shallow copy with the three merged fields swapped in; nothing is re-validated
+            return refined.model_copy(update={
+                "criteria_assessments": merged_criteria,
+                "criteria_met_count": sum(map(attrgetter("is_met"), merged_criteria)),
+                "criteria_total_count": len(merged_criteria),
+            })
         else:
             reasoning_chain.append(
                 f"[PolicyAnalyzer] {payer_name} refinement iteration {iteration}: "
@@ -495,7 +730,7 @@ class PolicyAnalyzerAgent:
     # Existing methods (unchanged interfaces)
     # ------------------------------------------------------------------
 
-    def _write_assessment_waypoint(
+    async def _write_assessment_waypoint(
         self,
         case_state: CaseState,
         assessments: Dict[str, CoverageAssessment],
@@ -503,7 +738,7 @@ class PolicyAnalyzerAgent:
         medication_info: Dict[str, Any]
     ) -> Optional[Path]:
         """
-        Write assessment waypoint file after analysis.
+        Queue the assessment waypoint file for the background writer after analysis.
 
         Args:
             case_state: Current case state
@@ -517,47 +752,46 @@ class PolicyAnalyzerAgent:
         if not self.waypoint_writer:
             return None
 
-        # Find best assessment for recommendation
-        best_payer = max(
-            assessments.keys(),
-            key=lambda p: assessments[p].approval_likelihood
-        )
-        best_assessment = assessments[best_payer]
-
-        # Determine AI recommendation
-        status = best_assessment.coverage_status.value
-        if status in ["covered", "likely_covered"]:
-            ai_recommendation = "APPROVE"
-        elif status in ["requires_pa", "conditional", "pend"]:
-            ai_recommendation = "PEND"
-        else:
-            ai_recommendation = "REQUIRES_HUMAN_REVIEW"
+        # Serialize gaps once for both the per-payer and aggregated views
+        per_payer_gaps, all_gaps = self._aggregate_gaps(assessments)
 
-        # Build reasoning summary
-        reasoning = f"Analysis of {len(assessments)} payer(s). "
-        reasoning += f"Best option: {best_payer} with {best_assessment.approval_likelihood:.0%} approval likelihood. "
-        reasoning += f"Status: {status}. "
-        reasoning += f"Criteria met: {best_assessment.criteria_met_count}/{best_assessment.criteria_total_count}. "
-
-        if best_assessment.documentation_gaps:
-            reasoning += f"Identified {len(best_assessment.documentation_gaps)} documentation gap(s)."
-
-        # Convert assessments to dicts
-        assessments_dict = {
-            payer: {
-                "status": a.coverage_status.value,
-                "likelihood": a.approval_likelihood,
+        # Convert assessments to dicts, finding the best payer in the same pass
+        assessments_dict = {}
+        best_payer = None
+        best_likelihood = -1.0
+        for payer, a in assessments.items():
+            likelihood = a.approval_likelihood
+            assessments_dict[payer] = {
+                "status": _STATUS_VALUE[a.coverage_status],
+                "likelihood": likelihood,
                 "criteria_met": a.criteria_met_count,
                 "criteria_total": a.criteria_total_count,
-                "gaps": [g.model_dump() for g in a.documentation_gaps]
+                "gaps": per_payer_gaps[payer]
             }
-            for payer, a in assessments.items()
-        }
+            # Strict > keeps the first payer on ties, matching compare_assessments
+            if likelihood > best_likelihood:
+                best_likelihood = likelihood
+                best_payer = payer
+        best_assessment = assessments[best_payer]
 
-        # Get all gaps
-        all_gaps = self.get_all_documentation_gaps(assessments)
+        # Determine AI recommendation
+        status = assessments_dict[best_payer]["status"]
+        ai_recommendation = _STATUS_RECOMMENDATION.get(status, "REQUIRES_HUMAN_REVIEW")
 
-        return self.waypoint_writer.write_assessment_waypoint(
+        # Build reasoning summary
+        gaps_suffix = (
+            f"Identified {len(best_assessment.documentation_gaps)} documentation gap(s)."
+            if best_assessment.documentation_gaps else ""
+        )
+        reasoning = (
+            f"Analysis of {len(assessments)} payer(s). "
+            f"Best option: {best_payer} with {best_likelihood:.0%} approval likelihood. "
+            f"Status: {status}. "
+            f"Criteria met: {best_assessment.criteria_met_count}/{best_assessment.criteria_total_count}. "
+            f"{gaps_suffix}"
+        )
+
+        return await self.waypoint_writer.enqueue_assessment_waypoint(
             case_id=case_state.case_id,
             patient_info={
                 "patient_id": case_state.patient.patient_id,
@@ -602,49 +836,7 @@ class PolicyAnalyzerAgent:
             payer=payer_name
         )
 
-        patient = case_state.patient
-        medication = case_state.medication
-
-        if not patient or not medication:
-            raise ValueError("Patient and medication data required")
-
-        patient_info = {
-            "patient_id": patient.patient_id,
-            "name": f"{patient.first_name} {patient.last_name}",
-            "date_of_birth": patient.date_of_birth,
-            "diagnosis_codes": patient.diagnosis_codes,
-            "allergies": patient.allergies,
-            "contraindications": patient.contraindications,
-            "prior_treatments": medication.prior_treatments,
-            "lab_results": medication.supporting_labs,
-        }
-
-        # Enrich with full clinical context from patient data file
-        # so the LLM can identify documentation gaps (e.g. TB/Hep B screenings)
-        raw_patient = self._load_raw_patient_data(patient.patient_id)
-        if raw_patient:
-            for key in (
-                "pre_biologic_screening", "disease_activity", "clinical_history",
-                "laboratory_results", "procedures", "documentation_gaps",
-                "diagnoses", "prior_treatments",
-            ):
-                if key in raw_patient and key not in patient_info:
-                    patient_info[key] = raw_patient[key]
-
-        medication_info = {
-            "medication_name": medication.medication_name,
-            "generic_name": medication.generic_name,
-            "ndc_code": medication.ndc_code,
-            "dose": medication.dose,
-            "frequency": medication.frequency,
-            "route": medication.route,
-            "duration": medication.duration,
-            "diagnosis": medication.diagnosis,
-            "icd10_code": medication.icd10_code,
-            "prescriber_npi": medication.prescriber_npi,
-            "prescriber_name": medication.prescriber_name,
-            "clinical_rationale": medication.clinical_rationale
-        }
+        patient_info, medication_info, raw_patient = await self._build_contexts(case_state)
 
         # Evidence gap detection (LLM-first)
         evidence_warnings = await self._detect_evidence_gaps(patient_info, raw_patient)
@@ -658,11 +850,12 @@ class PolicyAnalyzerAgent:
             )
 
         # Initial assessment
-        assessment = await self.reasoner.assess_coverage(
-            patient_info=patient_info,
-            medication_info=medication_info,
-            payer_name=payer_name
-        )
+        async with self._llm_semaphore:
+            assessment = await self.reasoner.assess_coverage(
+                patient_info=patient_info,
+                medication_info=medication_info,
+                payer_name=payer_name
+            )
 
         # Iterative refinement
         reasoning_chain: List[str] = []
@@ -713,19 +906,22 @@ class PolicyAnalyzerAgent:
         best_payer = None
 
         for payer_name, assessment in assessments.items():
+            likelihood = assessment.approval_likelihood
+            gaps_count = len(assessment.documentation_gaps)
             comparison["assessments"][payer_name] = {
-                "status": assessment.coverage_status.value,
-                "likelihood": assessment.approval_likelihood,
+                "status": _STATUS_VALUE[assessment.coverage_status],
+                "likelihood": likelihood,
                 "criteria_met": f"{assessment.criteria_met_count}/{assessment.criteria_total_count}",
-                "gaps_count": len(assessment.documentation_gaps),
+                "gaps_count": gaps_count,
                 "step_therapy_required": assessment.step_therapy_required,
                 "step_therapy_satisfied": assessment.step_therapy_satisfied
             }
 
-            comparison["total_gaps"] += len(assessment.documentation_gaps)
+            comparison["total_gaps"] += gaps_count
 
-            if assessment.approval_likelihood > best_likelihood:
-                best_likelihood = assessment.approval_likelihood
+            # Strict > keeps the first payer on ties (a (likelihood, name) tuple max would not)
+            if likelihood > best_likelihood:
+                best_likelihood = likelihood
                 best_payer = payer_name
 
         comparison["best_likelihood"] = best_likelihood
@@ -753,57 +949,60 @@ class PolicyAnalyzerAgent:
         Returns:
             List of all unique documentation gaps
         """
-        all_gaps = []
-        seen_gap_ids = set()
+        return self._aggregate_gaps(assessments)[1]
+
+    def _aggregate_gaps(
+        self,
+        assessments: Dict[str, CoverageAssessment]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Serialize each documentation gap once into per-payer and cross-payer views.
+
+        Args:
+            assessments: Dictionary of payer assessments
+
+        Returns:
+            Tuple of (full gap dicts by payer, unique gaps sorted by priority)
+        """
+        # Common case: nothing to serialize, merge or sort
+        if not any(a.documentation_gaps for a in assessments.values()):
+            return {payer_name: [] for payer_name in assessments}, []
+
+        per_payer_gaps: Dict[str, List[Dict[str, Any]]] = {}
+        # Index by gap_id so a gap reported by several payers is merged in O(1)
+        gap_index: Dict[str, Dict[str, Any]] = {}
+        # Sort rank per gap_id, computed once at insertion
+        gap_rank: Dict[str, int] = {}
 
         for payer_name, assessment in assessments.items():
-            for gap in assessment.documentation_gaps:
-                # Avoid duplicates
-                if gap.gap_id not in seen_gap_ids:
-                    seen_gap_ids.add(gap.gap_id)
-                    all_gaps.append({
-                        "gap_id": gap.gap_id,
-                        "gap_type": gap.gap_type,
-                        "description": gap.description,
-                        "priority": gap.priority,
-                        "required_for": gap.required_for,
-                        "suggested_action": gap.suggested_action,
-                        "payers_affected": [payer_name]
-                    })
+            # One pydantic-core call per payer instead of a model_dump() per gap
+            payer_gaps = per_payer_gaps[payer_name] = _GAP_LIST_ADAPTER.dump_python(assessment.documentation_gaps)
+            for gap, dumped in zip(assessment.documentation_gaps, payer_gaps):
+                record = gap_index.get(gap.gap_id)
+                if record is None:
+                    record = {k: dumped[k] for k in _GAP_SUMMARY_FIELDS}
+                    record["payers_affected"] = [payer_name]
+                    gap_index[gap.gap_id] = record
+                    gap_rank[gap.gap_id] = _GAP_PRIORITY_ORDER.get(record["priority"], 99)
                 else:
                     # Add this payer to existing gap
-                    for existing in all_gaps:
-                        if existing["gap_id"] == gap.gap_id:
-                            existing["payers_affected"].append(payer_name)
-                            break
+                    record["payers_affected"].append(payer_name)
 
-        # Sort by priority
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        all_gaps.sort(key=lambda g: priority_order.get(g["priority"], 99))
+        # Sort by priority (stable, so first-reported order is kept within a priority)
+        all_gaps = [gap_index[gap_id] for gap_id in sorted(gap_index, key=gap_rank.__getitem__)]
 
-        return all_gaps
+        return per_payer_gaps, all_gaps
 
     @staticmethod
-    def _load_raw_patient_data(patient_id: str) -> Optional[Dict[str, Any]]:
-        """Load full raw patient JSON from data file for clinical context enrichment."""
-        patient_file = PATIENTS_DIR / f"{patient_id}.json"
-        if not patient_file.exists():
-            return None
-        try:
-            with open(patient_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning("Could not load raw patient data", patient_id=patient_id, error=str(e))
-            return None
-
+    async def _load_raw_patient_data(patient_id: str) -> Optional[Dict[str, Any]]:
+        """Load full raw patient JSON from data file for clinical context enrichment.
 
-# Global instance
-_policy_analyzer: Optional[PolicyAnalyzerAgent] = None
+        The stat/read/parse runs on a worker thread to keep disk I/O off the event loop.
+        """
+        return await asyncio.to_thread(_load_patient_file, patient_id)
 
 
+@lru_cache
 def get_policy_analyzer() -> PolicyAnalyzerAgent:
     """Get or create the global policy analyzer agent."""
-    global _policy_analyzer
-    if _policy_analyzer is None:
-        _policy_analyzer = PolicyAnalyzerAgent()
-    return _policy_analyzer
+    return PolicyAnalyzerAgent()
@@ -1,17 +1,57 @@
 """Recovery agent for handling denials and setbacks — LLM-powered."""
+import asyncio
 import json
+import os
 from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime
-from uuid import uuid4
+from operator import itemgetter
+
+import orjson
 
 from backend.models.strategy import RecoveryStrategy, AppealStrategy
 from backend.models.enums import TaskCategory
 from backend.reasoning.llm_gateway import get_llm_gateway
 from backend.reasoning.prompt_loader import get_prompt_loader
 from backend.config.logging_config import get_logger
+from backend.config.settings import get_settings
 
 logger = get_logger(__name__)
 
+# Policy text budget for recovery strategy prompts, in characters (~750 tokens)
+_POLICY_CONTEXT_CHARS = 3000
+
+# Denial types the classification prompt may return; anything else maps to "other"
+_VALID_DENIAL_TYPES = frozenset({
+    "medical_necessity", "documentation_incomplete",
+    "step_therapy", "prior_auth_expired", "not_covered", "other",
+})
+
+_VALID_URGENCIES = frozenset({"standard", "urgent", "emergent"})
+
+# Appeal strategy primary_approach -> recommended appeal type
+_APPEAL_APPROACH_TYPES = {
+    "peer_to_peer": "peer_to_peer",
+    "clinical_rationale": "standard",
+    "medical_necessity": "standard",
+    "policy_interpretation": "standard",
+    "formulary_exception": "standard",
+}
+
+# Ordered (keyword, classification, also_match_underlying_issues) rules for the
+# appeal's denial classification; the first matching rule wins
+_APPEAL_CLASSIFICATION_RULES = (
+    ("step therapy", "step_therapy", True),
+    ("documentation", "documentation_incomplete", True),
+    ("medical necessity", "medical_necessity", False),
+    ("formulary", "not_covered", False),
+    ("not covered", "not_covered", False),
+)
+
+
+def _compact_json(obj: Any) -> str:
+    """Serialize a prompt variable as compact JSON; indentation only costs input tokens."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class DenialClassification:
     """Classification of a denial for recovery planning."""
@@ -46,6 +86,8 @@ class RecoveryAgent:
         """Initialize the recovery agent."""
         self.llm_gateway = get_llm_gateway()
         self.prompt_loader = get_prompt_loader()
+        # Bounds in-flight LLM calls across concurrent denials to respect provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(get_settings().max_concurrent_recovery_llm_calls)
         logger.info("Recovery agent initialized")
 
     async def classify_denial(
@@ -66,34 +108,29 @@ class RecoveryAgent:
         prompt = self.prompt_loader.load(
             "recovery/denial_classification.txt",
             {
-                "denial_response": json.dumps(denial_response, indent=2, default=str),
-                "case_context": json.dumps({
+                "denial_response": _compact_json(denial_response),
+                "case_context": _compact_json({
                     "case_id": case_state.get("case_id", ""),
                     "stage": case_state.get("stage", ""),
                     "patient_data": case_state.get("patient_data", {}),
                     "medication_data": case_state.get("medication_data", {}),
                     "coverage_assessments": case_state.get("coverage_assessments", {}),
-                }, indent=2, default=str),
-                "documentation_gaps": json.dumps(
-                    case_state.get("documentation_gaps", []), indent=2, default=str
-                ),
+                }),
+                "documentation_gaps": _compact_json(case_state.get("documentation_gaps", [])),
             },
         )
 
-        result = await self.llm_gateway.generate(
-            task_category=TaskCategory.DENIAL_CLASSIFICATION,
-            prompt=prompt,
-            temperature=0.0,
-            response_format="json",
-        )
+        async with self._llm_semaphore:
+            result = await self.llm_gateway.generate(
+                task_category=TaskCategory.DENIAL_CLASSIFICATION,
+                prompt=prompt,
+                temperature=0.0,
+                response_format="json",
+            )
 
         # Parse LLM response
         denial_type = result.get("denial_type", "other")
-        valid_types = {
-            "medical_necessity", "documentation_incomplete",
-            "step_therapy", "prior_auth_expired", "not_covered", "other",
-        }
-        if denial_type not in valid_types:
+        if denial_type not in _VALID_DENIAL_TYPES:
             denial_type = "other"
 
         is_recoverable = result.get("is_recoverable", True)
@@ -103,7 +140,7 @@ class RecoveryAgent:
         linked_gap = linked_gaps[0] if linked_gaps else None
 
         urgency = result.get("urgency", "standard")
-        if urgency not in ("standard", "urgent", "emergent"):
+        if urgency not in _VALID_URGENCIES:
             urgency = "standard"
 
         classification = DenialClassification(
@@ -124,61 +161,82 @@ class RecoveryAgent:
 
         return classification
 
-    async def generate_recovery_strategies(
+    async def load_policy_context(
         self,
-        classification: DenialClassification,
         case_state: Dict[str, Any],
         payer_name: str
-    ) -> List[Dict[str, Any]]:
+    ) -> str:
         """
-        Generate recovery strategies using LLM reasoning.
+        Load the payer's policy text for recovery strategy prompts.
+
+        Runs the file lookup on a worker thread so it can overlap with denial
+        classification.
 
         Args:
-            classification: LLM-generated denial classification
             case_state: Current case state
             payer_name: Payer that denied
 
         Returns:
-            List of recovery options ranked by success probability
+            Policy document text, or a placeholder when none is available
         """
-        # Build policy context
-        policy_context = ""
         try:
             from backend.reasoning.policy_reasoner import get_policy_reasoner
             med_name = case_state.get("medication_data", {}).get(
                 "medication_request", case_state.get("medication_data", {})
             ).get("medication_name", "unknown")
-            policy_context = get_policy_reasoner().load_policy(payer_name, med_name)
+            return await asyncio.to_thread(get_policy_reasoner().load_policy, payer_name, med_name)
         except (FileNotFoundError, Exception) as e:
             logger.debug("Policy text unavailable for recovery strategy", error=str(e))
-            policy_context = "Policy document not available"
+            return "Policy document not available"
+
+    async def generate_recovery_strategies(
+        self,
+        classification: DenialClassification,
+        case_state: Dict[str, Any],
+        payer_name: str,
+        policy_context: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate recovery strategies using LLM reasoning.
+
+        Args:
+            classification: LLM-generated denial classification
+            case_state: Current case state
+            payer_name: Payer that denied
+            policy_context: Policy text from load_policy_context, if already loaded
+
+        Returns:
+            List of recovery options ranked by success probability
+        """
+        # Build policy context
+        if policy_context is None:
+            policy_context = await self.load_policy_context(case_state, payer_name)
 
         available_payers = list(case_state.get("payer_states", {}).keys())
 
         prompt = self.prompt_loader.load(
             "recovery/recovery_strategy.txt",
             {
-                "denial_classification": json.dumps({
+                "denial_classification": _compact_json({
                     "denial_type": classification.denial_type,
                     "root_cause": classification.root_cause,
                     "is_recoverable": classification.is_recoverable,
                     "urgency": classification.urgency,
                     "linked_intake_gap": classification.linked_intake_gap,
-                }, indent=2),
-                "patient_profile": json.dumps(
-                    case_state.get("patient_data", {}), indent=2, default=str
-                ),
-                "policy_context": policy_context[:3000],
-                "available_payers": json.dumps(available_payers),
+                }),
+                "patient_profile": _compact_json(case_state.get("patient_data", {})),
+                "policy_context": policy_context[:_POLICY_CONTEXT_CHARS],
+                "available_payers": _compact_json(available_payers),
             },
         )
 
-        result = await self.llm_gateway.generate(
-            task_category=TaskCategory.RECOVERY_STRATEGY,
-            prompt=prompt,
-            temperature=0.2,
-            response_format="json",
-        )
+        async with self._llm_semaphore:
+            result = await self.llm_gateway.generate(
+                task_category=TaskCategory.RECOVERY_STRATEGY,
+                prompt=prompt,
+                temperature=0.2,
+                response_format="json",
+            )
 
         # Parse: result may be a list directly or wrapped in {"response": ...}
         options = result if isinstance(result, list) else result.get("response", result)
@@ -192,33 +250,48 @@ class RecoveryAgent:
                     raw_response=options[:500],
                 )
                 raise ValueError(f"LLM returned invalid JSON for recovery strategies: {e}") from e
+        recommended_index = None
         if isinstance(options, dict):
+            recommended_index = options.get("recommended_index")
             # Unwrap common wrapper keys
-            for key in ("strategies", "recovery_strategies", "options"):
+            for key in ("options", "strategies", "recovery_strategies"):
                 if key in options and isinstance(options[key], list):
                     options = options[key]
                     break
             else:
                 options = [options]
 
-        # Ensure each option has required fields
+        # An explicit recommended_index is authoritative over per-option flags
+        if isinstance(recommended_index, int) and 0 <= recommended_index < len(options):
+            for i, opt in enumerate(options):
+                opt["is_recommended"] = i == recommended_index
+
+        # Ensure each option has required fields, noting whether the LLM recommended one
+        has_recommended = False
         for opt in options:
-            opt.setdefault("option_id", str(uuid4())[:8].upper())
+            if "option_id" not in opt:
+                opt["option_id"] = os.urandom(4).hex().upper()
             opt.setdefault("score", opt.get("success_probability", 0.5) * 10)
             opt.setdefault("success_probability", opt.get("score", 5.0) / 10)
+            if opt.get("is_recommended"):
+                has_recommended = True
 
         # Sort by success_probability descending
-        options.sort(key=lambda x: x.get("success_probability", 0), reverse=True)
+        options.sort(key=itemgetter("success_probability"), reverse=True)
 
         # Mark recommended
-        recommended_count = sum(1 for o in options if o.get("is_recommended"))
-        if recommended_count == 0 and options:
+        if has_recommended:
+            recommended_id = next(o["option_id"] for o in options if o.get("is_recommended"))
+        elif options:
             options[0]["is_recommended"] = True
+            recommended_id = options[0]["option_id"]
+        else:
+            recommended_id = None
 
         logger.info(
             "Recovery strategies generated (LLM)",
             num_options=len(options),
-            recommended=next((o["option_id"] for o in options if o.get("is_recommended")), None),
+            recommended=recommended_id,
         )
 
         return options
@@ -247,9 +320,12 @@ class RecoveryAgent:
             options[0],
         )
 
-        parallel = "parallel" in selected.get("name", "").lower() or any(
-            a.get("parallel") for a in selected.get("actions", [])
-        )
+        parallel = selected.get("parallel")
+        if not isinstance(parallel, bool):
+            # Older prompt responses carry no flag; infer it from name and actions
+            parallel = "parallel" in selected.get("name", "").lower() or any(
+                a.get("parallel") for a in selected.get("actions", [])
+            )
 
         return RecoveryStrategy(
             case_id=case_state.get("case_id", ""),
@@ -304,21 +380,22 @@ class RecoveryAgent:
         ).get("medication_name", "unknown")
 
         try:
-            policy_text = policy_reasoner.load_policy(payer_name, medication_name)
+            policy_text = await asyncio.to_thread(policy_reasoner.load_policy, payer_name, medication_name)
         except FileNotFoundError:
             policy_text = "Policy document not available"
 
         # Use Claude to generate appeal strategy
-        result = await self.llm_gateway.generate_appeal_strategy(
-            denial_context={
-                "denial_reason_code": denial_response.get("denial_reason_code") or denial_response.get("denial_code", ""),
-                "denial_reason": denial_response.get("denial_reason", ""),
-                "original_request": case_state.get("medication_data", {}),
-                "available_documentation": case_state.get("available_documents", [])
-            },
-            patient_info=case_state.get("patient_data", {}),
-            policy_text=policy_text
-        )
+        async with self._llm_semaphore:
+            result = await self.llm_gateway.generate_appeal_strategy(
+                denial_context={
+                    "denial_reason_code": denial_response.get("denial_reason_code") or denial_response.get("denial_code", ""),
+                    "denial_reason": denial_response.get("denial_reason", ""),
+                    "original_request": case_state.get("medication_data", {}),
+                    "available_documentation": case_state.get("available_documents", [])
+                },
+                patient_info=case_state.get("patient_data", {}),
+                policy_text=policy_text
+            )
 
         # Parse nested LLM response into AppealStrategy
         # LLM returns: {denial_analysis, appeal_strategy, documentation_needed,
@@ -347,29 +424,20 @@ class RecoveryAgent:
                 policy_refs.append(ref)
 
         # Map primary_approach to appeal type
-        approach_map = {
-            "peer_to_peer": "peer_to_peer",
-            "clinical_rationale": "standard",
-            "medical_necessity": "standard",
-            "policy_interpretation": "standard",
-            "formulary_exception": "standard",
-        }
         approach = strategy.get("primary_approach", "standard")
-        appeal_type = approach_map.get(approach, "standard")
+        appeal_type = _APPEAL_APPROACH_TYPES.get(approach, "standard")
 
         # Map denial analysis to classification
         issues = denial_analysis.get("underlying_issues", [])
-        addressable = denial_analysis.get("addressable_gaps", [])
-        classification = "other"
         stated = denial_analysis.get("stated_reason", "").lower()
-        if "step therapy" in stated or "step therapy" in " ".join(issues).lower():
-            classification = "step_therapy"
-        elif "documentation" in stated or "documentation" in " ".join(issues).lower():
-            classification = "documentation_incomplete"
-        elif "medical necessity" in stated:
-            classification = "medical_necessity"
-        elif "formulary" in stated or "not covered" in stated:
-            classification = "not_covered"
+        issues_text = " ".join(issues).lower()
+        classification = next(
+            (
+                label for keyword, label, match_issues in _APPEAL_CLASSIFICATION_RULES
+                if keyword in stated or (match_issues and keyword in issues_text)
+            ),
+            "other",
+        )
 
         # Build P2P talking points if P2P recommended
         p2p_points = None
@@ -59,6 +59,16 @@ class Settings(BaseSettings):
 
     # LLM Gateway
     llm_gateway_timeout_seconds: int = Field(default=180, description="Wall-clock timeout for LLM gateway generate() calls")
+    appeal_strategy_timeout_seconds: int = Field(default=120, description="Timeout for appeal strategy generation during recovery")
+    refinement_policy: str = Field(default="outcome_affecting", description="Which low-confidence criteria trigger policy re-evaluation: 'outcome_affecting' or 'all'")
+    max_concurrent_llm_calls: int = Field(default=4, description="Max concurrent LLM calls issued by the policy analyzer")
+    max_concurrent_recovery_llm_calls: int = Field(default=4, description="Max concurrent LLM calls issued by the recovery agent")
+
+    # MCP validation
+    mcp_max_concurrency: int = Field(default=16, description="Max concurrent MCP validation calls per process")
+    mcp_npi_timeout_seconds: float = Field(default=3.0, description="Timeout for a single NPI Registry lookup")
+    mcp_icd10_timeout_seconds: float = Field(default=3.0, description="Timeout for a single ICD-10 code lookup")
+    mcp_cms_timeout_seconds: float = Field(default=3.0, description="Timeout for a CMS coverage search")
 
     # Langfuse Observability (optional)
     langfuse_secret_key: str = Field(default="", description="Langfuse secret key")
@@ -67,6 +77,7 @@ class Settings(BaseSettings):
 
     # Data directories (relative to project root)
     patients_dir: str = Field(default="data/patients", description="Directory containing patient JSON files")
+    patient_json_stream_threshold_bytes: int = Field(default=1048576, description="Patient files above this size are stream-parsed for intake keys only")
     policies_dir: str = Field(default="data/policies", description="Directory containing policy files")
     historical_data_path: str = Field(default="data/historical_pa_cases.json", description="Path to historical PA cases")
 
@@ -3,6 +3,7 @@
 Standalone deployment for case orchestration, strategy generation, and PA workflows.
 Backend: port 8002 | Frontend dev: port 6002
 """
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,6 +25,9 @@ from backend.mock_services.scenarios import get_scenario_manager
 setup_logging(log_level="INFO")
 logger = get_logger(__name__)
 
+# Upper bound on how long shutdown waits for queued waypoint writes
+_WAYPOINT_FLUSH_TIMEOUT_SECONDS = 10.0
+
 
 class CorrelationIDMiddleware(BaseHTTPMiddleware):
     """Attach a correlation ID to every request for distributed tracing.
@@ -75,6 +79,15 @@ async def lifespan(app: FastAPI):
 
     logger.info("Shutting down Patient Services Platform")
 
+    try:
+        from backend.storage.waypoint_writer import get_waypoint_writer
+        await asyncio.wait_for(get_waypoint_writer().flush(), timeout=_WAYPOINT_FLUSH_TIMEOUT_SECONDS)
+        logger.info("Waypoint writes flushed")
+    except asyncio.TimeoutError:
+        logger.warning("Timed out flushing waypoint writes", timeout=_WAYPOINT_FLUSH_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning("Failed to flush waypoint writes", error=str(e))
+
     from backend.reasoning.langfuse_integration import shutdown_langfuse
     shutdown_langfuse()
 
@@ -34,6 +34,22 @@ class ICD10ValidationResult:
     invalid_count: int
     errors: List[str] = field(default_factory=list)
 
+    @classmethod
+    def from_codes(cls, code_infos: List[ICD10CodeInfo]) -> "ICD10ValidationResult":
+        """Summarize per-code validations into a batch result."""
+        valid_count = sum(1 for c in code_infos if c.is_valid)
+        invalid_count = len(code_infos) - valid_count
+        return cls(
+            codes=code_infos,
+            all_valid=invalid_count == 0,
+            valid_count=valid_count,
+            invalid_count=invalid_count,
+            errors=[
+                f"Invalid code: {c.code} - {', '.join(c.errors)}"
+                for c in code_infos if not c.is_valid
+            ]
+        )
+
 
 class ICD10Validator:
     """
@@ -122,19 +138,7 @@ class ICD10Validator:
             else:
                 code_infos.append(result)
 
-        valid_count = sum(1 for c in code_infos if c.is_valid)
-        invalid_count = len(code_infos) - valid_count
-
-        return ICD10ValidationResult(
-            codes=code_infos,
-            all_valid=invalid_count == 0,
-            valid_count=valid_count,
-            invalid_count=invalid_count,
-            errors=[
-                f"Invalid code: {c.code} - {', '.join(c.errors)}"
-                for c in code_infos if not c.is_valid
-            ]
-        )
+        return ICD10ValidationResult.from_codes(code_infos)
 
     async def search_codes(self, query: str, max_results: int = 20) -> List[ICD10CodeInfo]:
         """
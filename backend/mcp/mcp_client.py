@@ -38,7 +38,13 @@ class MCPClient:
 
     def __init__(self):
         """Initialize the MCP client with configuration from environment."""
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+        # One pooled HTTP/2 client for every MCP server: calls to the same host
+        # multiplex over a single TLS connection instead of opening new ones.
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
         self._configs: Dict[str, MCPServerConfig] = {}
         self._initialize_configs()
         logger.info("MCP client initialized")
@@ -464,25 +464,19 @@ class CaseOrchestrator:
         payer_states = state.get("payer_states", {})
         # Capture statuses before polling to detect progress
         previous_statuses = {p: s.get("status") for p, s in payer_states.items()}
-        updated_payer_states = dict(payer_states)
         state_updates = {}
 
-        for payer_name, payer_state in payer_states.items():
-            status = payer_state.get("status", "not_submitted")
-            # Check status for submitted/pending payers
-            if status in ["submitted", "pending", "under_review", "appeal_pending"]:
-                try:
-                    status_result = await coordinator.check_payer_status(state, payer_name)
-                    if "payer_states" in status_result:
-                        updated_payer_states.update(status_result["payer_states"])
-                    if status_result.get("recovery_needed"):
-                        state_updates["recovery_needed"] = True
-                        state_updates["recovery_reason"] = status_result.get("recovery_reason")
-                except Exception as e:
-                    logger.error("Failed to check payer status", payer=payer_name, error=str(e))
-
-        # Update state with new payer states and iteration counter
+        # Poll submitted/pending payers concurrently
+        status_result = await coordinator.check_all_payers_status(state)
+        updated_payer_states = status_result["payer_states"]
+        if status_result["recovery_needed"]:
+            state_updates["recovery_needed"] = True
+            state_updates["recovery_reason"] = status_result["recovery_reason"]
+
+        # Update state with new payer states, responses and iteration counter
         state_updates["payer_states"] = updated_payer_states
+        state_updates["denied_payers"] = status_result["denied_payers"]
+        state_updates["payer_responses"] = status_result["payer_responses"]
         state_updates["monitoring_iterations"] = iterations
 
         # Detect stale progress — if no payer status changed, track consecutive stalls
@@ -505,7 +499,11 @@ class CaseOrchestrator:
             }
 
         # Now check the updated response status
-        updated_state = {**state, **state_updates}
+        updated_state = {
+            **state,
+            **state_updates,
+            "payer_responses": {**state.get("payer_responses", {}), **status_result["payer_responses"]}
+        }
         response_status = check_payer_responses(updated_state)
 
         if response_status == "approved":
@@ -1,10 +1,26 @@
 """LangGraph state definitions for the case orchestrator."""
-from typing import TypedDict, Dict, List, Optional, Any, Annotated
-from operator import add
+from typing import TypedDict, Dict, List, Optional, Any, Annotated, Sequence
 
 from backend.models.enums import CaseStage
 
 
+def _concat(left: Optional[Sequence[Any]], right: Optional[Sequence[Any]]) -> List[Any]:
+    """Reducer that appends any sequence (list or tuple) onto the accumulated list."""
+    return [*(left or ()), *(right or ())]
+
+
+def _merge_payer_responses(
+    left: Optional[Dict[str, Dict[str, Any]]],
+    right: Optional[Dict[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Any]]:
+    """Reducer that folds per-payer response deltas into the existing map."""
+    if not right:
+        return left or {}
+    if not left:
+        return right
+    return {**left, **right}
+
+
 class OrchestratorState(TypedDict, total=False):
     """
     State for the LangGraph case orchestrator.
@@ -25,6 +41,7 @@ class OrchestratorState(TypedDict, total=False):
     # Payer information
     payers: List[str]
     payer_states: Dict[str, Dict[str, Any]]
+    denied_payers: List[str]  # Payers currently denied, refreshed whenever payer_states is written
 
     # Policy analysis results
     coverage_assessments: Dict[str, Dict[str, Any]]
@@ -43,10 +60,10 @@ class OrchestratorState(TypedDict, total=False):
     # Action tracking
     current_action: Optional[Dict[str, Any]]
     pending_actions: List[Dict[str, Any]]
-    completed_actions: Annotated[List[Dict[str, Any]], add]  # Accumulates across nodes
+    completed_actions: Annotated[List[Dict[str, Any]], _concat]  # Accumulates across nodes
 
     # Payer responses
-    payer_responses: Dict[str, Dict[str, Any]]
+    payer_responses: Annotated[Dict[str, Dict[str, Any]], _merge_payer_responses]  # Merges per-payer deltas
 
     # Recovery
     recovery_needed: bool
@@ -55,7 +72,7 @@ class OrchestratorState(TypedDict, total=False):
 
     # Errors and messages
     error: Optional[str]
-    messages: Annotated[List[str], add]  # Accumulates messages
+    messages: Annotated[List[str], _concat]  # Accumulates messages
 
     # Human decision gate (Anthropic skill pattern)
     requires_human_decision: bool
@@ -111,6 +128,7 @@ def create_initial_state(
         medication_data=medication_data,
         payers=payers,
         payer_states={payer: {"payer_name": payer, "status": "not_submitted", "required_documents": []} for payer in payers},
+        denied_payers=[],
         coverage_assessments={},
         documentation_gaps=[],
         digitized_policies={},
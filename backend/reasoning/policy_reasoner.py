@@ -4,6 +4,7 @@ import hashlib
 import json
 import re
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from uuid import uuid4 as _uuid4
@@ -20,6 +21,22 @@ from backend.config.settings import get_settings
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _read_policy_file(policy_path: Path, mtime_ns: int) -> str:
+    """Read a local policy text file; keyed on mtime so an edited file is re-read."""
+    with open(policy_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _load_policy_file(policy_path: Path) -> Optional[str]:
+    """Return a policy file's text through the mtime-keyed cache, or None if it doesn't exist."""
+    try:
+        mtime_ns = policy_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_policy_file(policy_path, mtime_ns)
+
+
 class PolicyReasoner:
     """
     Analyzes payer policies to assess coverage eligibility.
@@ -175,17 +192,17 @@ class PolicyReasoner:
                 policy_path.relative_to(policies_root)
             except ValueError:
                 continue
-            if policy_path.exists():
-                with open(policy_path, "r", encoding="utf-8") as f:
-                    return f.read()
+            policy_text = _load_policy_file(policy_path)
+            if policy_text is not None:
+                return policy_text
 
         # Try generic payer policy
         policy_path = (self.policies_dir / f"{payer_key}.txt").resolve()
         try:
             policy_path.relative_to(policies_root)
-            if policy_path.exists():
-                with open(policy_path, "r", encoding="utf-8") as f:
-                    return f.read()
+            policy_text = _load_policy_file(policy_path)
+            if policy_text is not None:
+                return policy_text
         except ValueError:
             pass
 
@@ -281,7 +298,7 @@ class PolicyReasoner:
         policy_text = await self._load_policy_text_from_db(payer_name, med_name)
         if not policy_text:
             try:
-                policy_text = self.load_policy(payer_name=payer_name, medication_name=med_name)
+                policy_text = await asyncio.to_thread(self.load_policy, payer_name, med_name)
             except FileNotFoundError:
                 policy_text = ""
             if not policy_text and not policy_criteria_context:
@@ -4,7 +4,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from functools import lru_cache
 
 from backend.config.logging_config import get_logger
@@ -22,17 +22,34 @@ class PromptResult:
     source: str = "local"        # "langfuse" or "local"
 
 
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+@lru_cache(maxsize=100)
+def _compile_template(template: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a template once into its literal segments and the placeholder names between them."""
+    parts = _PLACEHOLDER_RE.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def _format_variable(value: Any) -> str:
+    """Render a substitution value; dicts and lists are pretty-printed as JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, indent=2, default=str)
+    return str(value)
+
+
 def _substitute_variables(template: str, variables: Dict[str, Any]) -> str:
-    """Substitute {variable_name} placeholders in a template string."""
-    result = template
-    for key, value in variables.items():
-        placeholder = "{" + key + "}"
-        if isinstance(value, (dict, list)):
-            value_str = json.dumps(value, indent=2, default=str)
-        else:
-            value_str = str(value)
-        result = result.replace(placeholder, value_str)
-    return result
+    """Substitute {variable_name} placeholders in a template string.
+
+    Placeholders without a matching variable are left in place.
+    """
+    literals, names = _compile_template(template)
+    out = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        out.append(_format_variable(variables[name]) if name in variables else "{" + name + "}")
+        out.append(literal)
+    return "".join(out)
 
 
 class PromptLoader:
@@ -102,12 +119,7 @@ class PromptLoader:
                 # Langfuse compile() expects {{var}} syntax and handles substitution
                 if variables:
                     # Langfuse compile needs string values
-                    compile_vars = {}
-                    for k, v in variables.items():
-                        if isinstance(v, (dict, list)):
-                            compile_vars[k] = json.dumps(v, indent=2, default=str)
-                        else:
-                            compile_vars[k] = str(v)
+                    compile_vars = {k: _format_variable(v) for k, v in variables.items()}
                     compiled = lf_prompt.compile(**compile_vars)
                 else:
                     compiled = lf_prompt.compile()
@@ -128,9 +140,11 @@ class PromptLoader:
         """
         result = self.load_with_meta(prompt_path, variables)
 
-        # Check for unsubstituted variables (local path only — Langfuse handles its own)
+        # Check for unsubstituted variables (local path only — Langfuse handles its own).
+        # Checked against the compiled template, so braces inside substituted values don't count.
         if result.source == "local":
-            remaining_vars = re.findall(r"\{(\w+)\}", result.text)
+            _, names = _compile_template(self._load_raw_prompt(prompt_path))
+            remaining_vars = [name for name in names if not variables or name not in variables]
             if remaining_vars:
                 logger.warning(
                     "Unsubstituted variables in prompt",
@@ -153,12 +167,12 @@ class PromptLoader:
 
     def get_prompt_variables(self, prompt_path: str) -> list:
         """Extract variable names from a prompt template."""
-        raw_prompt = self._load_raw_prompt(prompt_path)
-        return re.findall(r"\{(\w+)\}", raw_prompt)
+        return list(_compile_template(self._load_raw_prompt(prompt_path))[1])
 
     def clear_cache(self) -> None:
         """Clear both local and Langfuse prompt caches."""
         self._load_raw_prompt.cache_clear()
+        _compile_template.cache_clear()
         self._langfuse_cache.clear()
         logger.info("Prompt cache cleared (local + Langfuse)")
 
@@ -18,7 +18,7 @@ def serialize_for_json(obj: Any) -> Any:
         return obj.isoformat()
     elif isinstance(obj, dict):
         return {k: serialize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple)):
         return [serialize_for_json(item) for item in obj]
     elif isinstance(obj, Enum):
         return obj.value
@@ -1617,25 +1617,14 @@ class CaseService:
         )
         orch_state["payer_states"] = payer_states
 
-        # Poll each submitted/pending payer
-        updated_payer_states = dict(payer_states)
-        payer_responses = {}
-        recovery_needed = False
-        recovery_reason = None
-        for payer_name, payer_state in payer_states.items():
-            status = payer_state.get("status", "not_submitted")
-            if status in ["submitted", "pending", "under_review"]:
-                try:
-                    status_result = await coordinator.check_payer_status(orch_state, payer_name)
-                    if "payer_states" in status_result:
-                        updated_payer_states.update(status_result["payer_states"])
-                    if "payer_responses" in status_result:
-                        payer_responses.update(status_result["payer_responses"])
-                    if status_result.get("recovery_needed"):
-                        recovery_needed = True
-                        recovery_reason = status_result.get("recovery_reason")
-                except Exception as e:
-                    logger.error("Failed to check payer status", payer=payer_name, error=str(e))
+        # Poll each submitted/pending payer concurrently
+        status_result = await coordinator.check_all_payers_status(
+            orch_state, statuses=frozenset({"submitted", "pending", "under_review"})
+        )
+        updated_payer_states = status_result["payer_states"]
+        payer_responses = status_result["payer_responses"]
+        recovery_needed = status_result["recovery_needed"]
+        recovery_reason = status_result["recovery_reason"]
 
         orch_state["payer_states"] = updated_payer_states
         orch_state["payer_responses"] = payer_responses
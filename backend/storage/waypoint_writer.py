@@ -7,15 +7,37 @@ file-based waypoint outputs for portable audit trails:
 - outputs/notification_{case_id}.txt - Provider notification letter
 """
 
+import asyncio
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+import orjson
 
 from backend.config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Pretty-printed like the previous json.dump(indent=2); datetimes pass through
+# to _json_default so they keep their str() form.
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Background write queue: bounded so a stalled disk applies backpressure, and
+# drained in batches so one durability pass covers many waypoint files.
+_WRITE_QUEUE_SIZE = 256
+_WRITE_BATCH_SIZE = 32
+_WRITE_BATCH_WAIT_SECONDS = 0.05
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize pydantic models by dumping them; anything else falls back to str()."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
 # Project root directory (parent of backend/)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -47,6 +69,11 @@ class WaypointWriter:
         self.waypoints_dir.mkdir(parents=True, exist_ok=True)
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
 
+        # Created lazily on first enqueue so they bind to the running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
         logger.info(
             "Waypoint writer initialized",
             waypoints_dir=str(self.waypoints_dir),
@@ -82,6 +109,76 @@ class WaypointWriter:
         Returns:
             Path to the written waypoint file
         """
+        waypoint = self._build_assessment_waypoint(
+            case_id=case_id,
+            patient_info=patient_info,
+            medication_info=medication_info,
+            coverage_assessments=coverage_assessments,
+            documentation_gaps=documentation_gaps,
+            ai_recommendation=ai_recommendation,
+            confidence_score=confidence_score,
+            reasoning=reasoning
+        )
+
+        file_path = self.waypoints_dir / f"assessment_{case_id}.json"
+        self._write_json(file_path, waypoint)
+
+        logger.info(
+            "Assessment waypoint written",
+            case_id=case_id,
+            path=str(file_path)
+        )
+
+        return file_path
+
+    async def enqueue_assessment_waypoint(
+        self,
+        case_id: str,
+        patient_info: Dict[str, Any],
+        medication_info: Dict[str, Any],
+        coverage_assessments: Dict[str, Any],
+        documentation_gaps: List[Dict[str, Any]],
+        ai_recommendation: str,
+        confidence_score: float,
+        reasoning: str
+    ) -> Path:
+        """
+        Queue an assessment waypoint for the background writer.
+
+        Takes the same arguments as write_assessment_waypoint but returns as
+        soon as the payload is queued; the file appears once the next batch
+        is flushed.
+
+        Returns:
+            Path the waypoint file will be written to
+        """
+        waypoint = self._build_assessment_waypoint(
+            case_id=case_id,
+            patient_info=patient_info,
+            medication_info=medication_info,
+            coverage_assessments=coverage_assessments,
+            documentation_gaps=documentation_gaps,
+            ai_recommendation=ai_recommendation,
+            confidence_score=confidence_score,
+            reasoning=reasoning
+        )
+
+        file_path = self.waypoints_dir / f"assessment_{case_id}.json"
+        await self.enqueue(file_path, waypoint)
+        return file_path
+
+    def _build_assessment_waypoint(
+        self,
+        case_id: str,
+        patient_info: Dict[str, Any],
+        medication_info: Dict[str, Any],
+        coverage_assessments: Dict[str, Any],
+        documentation_gaps: List[Dict[str, Any]],
+        ai_recommendation: str,
+        confidence_score: float,
+        reasoning: str
+    ) -> Dict[str, Any]:
+        """Build the assessment waypoint payload."""
         waypoint = {
             "waypoint_type": "assessment",
             "version": "1.0",
@@ -125,16 +222,7 @@ class WaypointWriter:
             }
         }
 
-        file_path = self.waypoints_dir / f"assessment_{case_id}.json"
-        self._write_json(file_path, waypoint)
-
-        logger.info(
-            "Assessment waypoint written",
-            case_id=case_id,
-            path=str(file_path)
-        )
-
-        return file_path
+        return waypoint
 
     def write_decision_waypoint(
         self,
@@ -445,8 +533,88 @@ Case ID: {case_id}
 
     def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
         """Write JSON data to file with pretty formatting."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        path.write_bytes(orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS))
+
+    async def enqueue(self, path: Path, data: Dict[str, Any]) -> None:
+        """
+        Queue a JSON waypoint for the background writer.
+
+        Blocks only when the queue is full, so callers are not held up by
+        disk flushes.
+        """
+        await self._bind_queue().put((path, data))
+
+    async def flush(self) -> None:
+        """Wait until every queued waypoint has been written."""
+        if self._queue is not None:
+            await self._bind_queue().join()
+
+    def _bind_queue(self) -> asyncio.Queue:
+        """Return the queue for the running loop, making sure a drain task serves it."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # (Re)bind to the running loop — the writer is a process-wide singleton.
+            # Waypoints still queued on a previous loop carry over to the new queue.
+            stale = self._queue
+            self._queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._loop = loop
+            self._drain_task = None
+            while stale is not None and not stale.empty():
+                self._queue.put_nowait(stale.get_nowait())
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Pop up to a batch of queued waypoints and write them in a worker thread."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + _WRITE_BATCH_WAIT_SECONDS
+            try:
+                while len(batch) < _WRITE_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Loop shutting down mid-batch: hand the unwritten items back so
+                # the next loop's drain picks them up
+                for item in batch:
+                    queue.put_nowait(item)
+                    queue.task_done()
+                raise
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+                logger.info("Waypoint batch written", count=len(batch))
+            except Exception as e:
+                logger.error(
+                    "Failed to write waypoint batch",
+                    paths=[str(path) for path, _ in batch],
+                    error=str(e)
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple[Path, Dict[str, Any]]]) -> None:
+        """Write each file in the batch, then fsync them together in one pass."""
+        files = []
+        try:
+            for path, data in batch:
+                f = open(path, "wb")
+                files.append(f)
+                f.write(orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS))
+            for f in files:
+                f.flush()
+                os.fsync(f.fileno())
+        finally:
+            for f in files:
+                f.close()
 
     def get_waypoint_path(self, case_id: str, waypoint_type: str) -> Path:
         """Get path to a waypoint file."""
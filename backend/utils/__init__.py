@@ -0,0 +1,4 @@
+"""Shared utility helpers."""
+from .ttl_cache import AsyncTTLCache
+
+__all__ = ["AsyncTTLCache"]
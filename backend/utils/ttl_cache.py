@@ -0,0 +1,104 @@
+"""Async-aware TTL + LRU cache for memoizing external call results."""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    """Mark a failure retrieved so a compute whose callers all left does not warn."""
+    if not task.cancelled():
+        task.exception()
+
+
+class AsyncTTLCache:
+    """
+    Bounded LRU cache whose entries expire after a TTL.
+
+    ``get_or_compute`` de-duplicates concurrent misses: while one coroutine
+    computes a key, other callers for the same key await its result instead
+    of issuing their own call. A cancelled caller stops waiting without
+    cancelling the shared computation. Failures are never cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 300.0):
+        self._maxsize = maxsize
+        self._default_ttl = default_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value, or ``default`` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (value, time.monotonic() + (ttl if ttl is not None else self._default_ttl))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or compute, cache and return it.
+
+        Args:
+            key: Cache key
+            coro_factory: Zero-arg callable returning the awaitable to run on a miss
+            ttl: Entry lifetime in seconds (defaults to the cache's default_ttl)
+            cache_if: Optional predicate; results failing it are returned but not cached
+
+        Returns:
+            The cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Every caller, including the first, awaits the shared task through a shield
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = asyncio.ensure_future(self._compute(key, coro_factory, ttl, cache_if))
+            inflight.add_done_callback(_retrieve_exception)
+            self._inflight[key] = inflight
+        return await asyncio.shield(inflight)
+
+    async def _compute(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> Any:
+        """Run a miss to completion, caching the value if it qualifies."""
+        try:
+            value = await coro_factory()
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)